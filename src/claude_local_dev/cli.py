@@ -2,14 +2,69 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
 
 from claude_local_dev import __version__
 
+# Subcommand -> module in claude_local_dev.commands that registers it, in
+# the order they appear in --help
+_COMMAND_MODULES = {
+    "init": "init",
+    "add": "add",
+    "remove": "remove",
+    "list": "list",
+    "verify": "verify",
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Import a command's module only when that command is looked up.
+
+    Running `add` imports commands/add.py and nothing else; --help and
+    completion list every command and so import them all.
+
+    ctx is Any: TyperGroup takes a click.Context, or in newer typer
+    releases its bundled typer._click Context, and no one annotation
+    fits both.
+    """
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name not in self.commands:
+            if cmd_name in _COMMAND_MODULES:
+                self._load([cmd_name])
+            else:
+                # Unknown name: load everything so typo suggestions are complete
+                self._load(list(_COMMAND_MODULES))
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        self._load(list(_COMMAND_MODULES))
+        return super().list_commands(ctx)
+
+    def _load(self, names: list[str]) -> None:
+        missing = [name for name in names if name not in self.commands]
+        if not missing:
+            return
+        for name in missing:
+            importlib.import_module(f"claude_local_dev.commands.{_COMMAND_MODULES[name]}")
+        built = typer.main.get_group(app).commands
+        # Rebuild in declaration order so help output is stable
+        self.commands = {
+            name: self.commands.get(name) or built[name]
+            for name in _COMMAND_MODULES
+            if name in self.commands or name in built
+        }
+
+
 app = typer.Typer(
     name="claude-local-dev",
     help="Manage a local-dev marketplace for Claude Code plugins.",
     no_args_is_help=True,
+    cls=_LazyGroup,
 )
 
 
@@ -29,13 +84,5 @@ def main_callback(
     pass
 
 
-# Import commands to register them
-from claude_local_dev.commands import init as _init_cmd  # noqa: E402, F401
-from claude_local_dev.commands import add as _add_cmd  # noqa: E402, F401
-from claude_local_dev.commands import remove as _remove_cmd  # noqa: E402, F401
-from claude_local_dev.commands import list as _list_cmd  # noqa: E402, F401
-from claude_local_dev.commands import verify as _verify_cmd  # noqa: E402, F401
-
-
 def main() -> None:
     app()
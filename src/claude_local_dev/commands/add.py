@@ -2,27 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
 from claude_local_dev.cli import app
-from claude_local_dev.config import get_local_dev_cache_dir, get_local_dev_plugins_dir
-from claude_local_dev.errors import JunctionError
+from claude_local_dev.config import paths
+from claude_local_dev.errors import JunctionError, PluginNotFound
 from claude_local_dev.junction import create_link, is_link, remove_link
 from claude_local_dev.registry import (
-    add_installed_plugin,
-    add_marketplace_plugin,
-    enable_plugin,
-    get_plugin_name,
-    get_plugin_version,
+    RegistryTransaction,
     is_marketplace_registered,
-    read_plugin_json,
+    read_plugin_metadata,
     validate_plugin_name,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def console() -> Console:
+    """Build the Rich console on first use rather than at import."""
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command()
@@ -36,25 +42,27 @@ def add(
     ),
 ) -> None:
     """Register a local plugin: create junction, update registry, enable."""
+    dirs = paths()
+
     # Validate marketplace exists
     if not is_marketplace_registered():
-        console.print(
+        console().print(
             "[red]Marketplace not initialized.[/red] Run `claude-local-dev init` first."
         )
         raise typer.Exit(code=1)
 
-    # Validate plugin structure
-    plugin_json_path = plugin_path / ".claude-plugin" / "plugin.json"
-    if not plugin_json_path.exists():
-        console.print(
+    # Validate plugin structure — a missing plugin.json surfaces from the read
+    try:
+        plugin_name, plugin_version, plugin_meta = read_plugin_metadata(
+            plugin_path, required=True
+        )
+    except PluginNotFound:
+        console().print(
             f"[red]Not a valid plugin:[/red] {plugin_path}\n"
             f"  Missing .claude-plugin/plugin.json"
         )
         raise typer.Exit(code=1)
 
-    plugin_meta = read_plugin_json(plugin_path)
-    plugin_name = plugin_meta.get("name") or plugin_path.name
-    plugin_version = plugin_meta.get("version", "1.0.0")
     plugin_description = plugin_meta.get("description", "")
     plugin_author = plugin_meta.get("author", {}).get("name", "")
 
@@ -62,61 +70,58 @@ def add(
     try:
         validate_plugin_name(plugin_name)
     except ValueError as e:
-        console.print(f"[red]Invalid plugin name:[/red] {e}")
+        console().print(f"[red]Invalid plugin name:[/red] {e}")
         raise typer.Exit(code=1)
 
-    plugins_dir = get_local_dev_plugins_dir()
-    link_path = plugins_dir / plugin_name
+    link_path = dirs.plugins / plugin_name
 
     # Compute cache path — this is where Claude Code actually loads from
-    cache_dir = get_local_dev_cache_dir() / plugin_name
-    cache_version_path = cache_dir / plugin_version
+    cache_version_path = dirs.cache / plugin_name / plugin_version
 
     # Check if already registered
     if is_link(link_path):
-        console.print(
+        console().print(
             f"[yellow]Plugin already registered:[/yellow] {plugin_name}\n"
             f"  Junction: {link_path}"
         )
         # Ensure cache entry exists
         if not cache_version_path.exists():
-            cache_dir.mkdir(parents=True, exist_ok=True)
             try:
                 create_link(cache_version_path, plugin_path)
-                console.print(f"  Cache entry created: {cache_version_path}")
+                console().print(f"  Cache entry created: {cache_version_path}")
             except JunctionError as e:
-                console.print(f"  [yellow]Warning: cache junction failed:[/yellow] {e}")
+                console().print(f"  [yellow]Warning: cache junction failed:[/yellow] {e}")
         # Update all registry entries to ensure consistency
-        install_path = str(cache_version_path)
-        add_installed_plugin(plugin_name, install_path, version=plugin_version)
-        add_marketplace_plugin(plugin_name, plugin_description, plugin_version, plugin_author)
-        enable_plugin(plugin_name)
-        console.print("  Registry entries refreshed.")
+        with RegistryTransaction() as tx:
+            tx.add_installed(plugin_name, str(cache_version_path), version=plugin_version)
+            tx.add_marketplace(plugin_name, plugin_description, plugin_version, plugin_author)
+            tx.enable(plugin_name)
+        console().print("  Registry entries refreshed.")
         return
 
     # Create marketplace junction
     try:
         create_link(link_path, plugin_path)
     except JunctionError as e:
-        console.print(f"[red]Failed to create junction:[/red] {e}")
+        console().print(f"[red]Failed to create junction:[/red] {e}")
         raise typer.Exit(code=1)
 
     # Create cache junction — Claude Code loads plugins from here
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    # (create_link creates the cache dir as needed)
     try:
         if cache_version_path.exists():
             remove_link(cache_version_path)
         create_link(cache_version_path, plugin_path)
     except JunctionError as e:
-        console.print(f"[yellow]Warning: cache junction failed:[/yellow] {e}")
+        console().print(f"[yellow]Warning: cache junction failed:[/yellow] {e}")
         # Non-fatal: marketplace junction still works as fallback
 
     # Update registry — rollback junctions if this fails
     try:
-        install_path = str(cache_version_path)
-        add_installed_plugin(plugin_name, install_path, version=plugin_version)
-        add_marketplace_plugin(plugin_name, plugin_description, plugin_version, plugin_author)
-        enable_plugin(plugin_name)
+        with RegistryTransaction() as tx:
+            tx.add_installed(plugin_name, str(cache_version_path), version=plugin_version)
+            tx.add_marketplace(plugin_name, plugin_description, plugin_version, plugin_author)
+            tx.enable(plugin_name)
     except Exception as e:
         # Rollback: remove the junctions we just created
         try:
@@ -127,12 +132,12 @@ def add(
             remove_link(cache_version_path)
         except JunctionError:
             pass
-        console.print(f"[red]Failed to update registry:[/red] {e}")
-        console.print("  Junctions rolled back.")
+        console().print(f"[red]Failed to update registry:[/red] {e}")
+        console().print("  Junctions rolled back.")
         raise typer.Exit(code=1)
 
-    console.print(f"[green]Plugin registered:[/green] {plugin_name}")
-    console.print(f"  Source:   {plugin_path}")
-    console.print(f"  Junction: {link_path}")
-    console.print(f"  Cache:    {cache_version_path}")
-    console.print(f"  Version:  {plugin_version}")
+    console().print(f"[green]Plugin registered:[/green] {plugin_name}")
+    console().print(f"  Source:   {plugin_path}")
+    console().print(f"  Junction: {link_path}")
+    console().print(f"  Cache:    {cache_version_path}")
+    console().print(f"  Version:  {plugin_version}")
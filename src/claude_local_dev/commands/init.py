@@ -2,40 +2,51 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
 from claude_local_dev.cli import app
-from claude_local_dev.config import get_local_dev_dir, get_local_dev_plugins_dir, get_marketplace_json_path
-from claude_local_dev.registry import is_marketplace_registered, read_marketplace_manifest, register_marketplace, write_marketplace_manifest
+from claude_local_dev.config import get_marketplace_json_path, paths
+from claude_local_dev.junction import ensure_dir
+from claude_local_dev.registry import RegistryTransaction, load_known_marketplaces
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def console() -> Console:
+    """Build the Rich console on first use rather than at import."""
+    from rich.console import Console
 
-console = Console()
+    return Console()
 
 
 @app.command()
 def init() -> None:
     """Create the local-dev marketplace directory structure and register it."""
-    plugins_dir = get_local_dev_plugins_dir()
-    local_dev_dir = get_local_dev_dir()
+    dirs = paths()
+    plugins_dir = dirs.plugins
+    local_dev_dir = dirs.marketplace
 
     # Create directory structure
-    plugins_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(plugins_dir)
 
-    # Create marketplace.json if missing
-    manifest_path = get_marketplace_json_path()
-    if not manifest_path.exists():
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        write_marketplace_manifest(read_marketplace_manifest())
-        console.print(f"  Manifest: {manifest_path}")
+    # Create marketplace.json if missing and register in known_marketplaces.json
+    known, already_registered = load_known_marketplaces()
+    with RegistryTransaction() as tx:
+        created_manifest = tx.ensure_manifest()
+        tx.register(preloaded=known)
 
-    # Register in known_marketplaces.json
-    already_registered = is_marketplace_registered()
-    register_marketplace()
+    if created_manifest:
+        console().print(f"  Manifest: {get_marketplace_json_path()}")
 
     if already_registered:
-        console.print(f"[yellow]Marketplace already registered.[/yellow] Updated entry.")
+        console().print(f"[yellow]Marketplace already registered.[/yellow] Updated entry.")
     else:
-        console.print(f"[green]Marketplace registered:[/green] local-dev")
+        console().print(f"[green]Marketplace registered:[/green] local-dev")
 
-    console.print(f"  Directory: {local_dev_dir}")
-    console.print(f"  Plugins:   {plugins_dir}")
+    console().print(f"  Directory: {local_dev_dir}")
+    console().print(f"  Plugins:   {plugins_dir}")
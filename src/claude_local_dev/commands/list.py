@@ -2,39 +2,63 @@
 
 from __future__ import annotations
 
+import functools
+import os
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from claude_local_dev.cli import app
-from claude_local_dev.config import get_local_dev_cache_dir, get_local_dev_plugins_dir
-from claude_local_dev.junction import is_link, is_link_healthy, link_target
+from claude_local_dev.config import paths
+from claude_local_dev.junction import LinkInfo, dir_names, fast_exists, scan_links
 from claude_local_dev.registry import (
     is_marketplace_registered,
-    is_plugin_enabled,
+    list_enabled_local_dev_plugins,
     list_installed_local_dev_plugins,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def console() -> Console:
+    """Build the Rich console on first use rather than at import."""
+    from rich.console import Console
+
+    return Console()
+
+
+_NO_LINK = LinkInfo(is_link=False, target=None, target_exists=False)
+
+# Table cells, indexed by a bool where there are two variants
+_ENABLED_CELL = ("[red]no[/red]", "[green]yes[/green]")
+_CACHE_CELL = ("[red]missing[/red]", "[green]ok[/green]")
+_JUNCTION_OK = "[green]ok[/green]"
+_JUNCTION_BROKEN = "[red]broken[/red]"
+_JUNCTION_MISSING = "[red]missing[/red]"
+_UNKNOWN_TARGET = "[red]?[/red]"
+_DASH = "[dim]-[/dim]"
 
 
 @app.command(name="list")
 def list_plugins() -> None:
     """Show registered local-dev plugins with status information."""
     if not is_marketplace_registered():
-        console.print(
+        console().print(
             "[yellow]Marketplace not initialized.[/yellow] Run `claude-local-dev init` first."
         )
         raise typer.Exit(code=1)
 
     installed = list_installed_local_dev_plugins()
-    plugins_dir = get_local_dev_plugins_dir()
-    cache_dir = get_local_dev_cache_dir()
+    dirs = paths()
 
     if not installed:
-        console.print("[dim]No local-dev plugins registered.[/dim]")
+        console().print("[dim]No local-dev plugins registered.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title="Local-Dev Plugins")
     table.add_column("Name", style="cyan")
     table.add_column("Version")
@@ -43,34 +67,37 @@ def list_plugins() -> None:
     table.add_column("Cache")
     table.add_column("Target")
 
+    # One scandir pass over the junction directory instead of per-row stats
+    links = scan_links(dirs.plugins)
+    cache_root = str(dirs.cache)
+    sep = os.sep
+    # settings.json and the cache dir are read once, not once per row
+    enabled_names = frozenset(list_enabled_local_dev_plugins())
+    cached_names = dir_names(dirs.cache)
+
     for name, records in sorted(installed.items()):
         version = records[0].get("version", "?") if records else "?"
-        enabled = is_plugin_enabled(name)
-        link_path = plugins_dir / name
-        has_link = is_link(link_path)
-        healthy = is_link_healthy(link_path) if has_link else False
-
-        enabled_str = "[green]yes[/green]" if enabled else "[red]no[/red]"
-
-        if has_link and healthy:
-            junction_str = "[green]ok[/green]"
-            target = link_target(link_path)
-            target_str = str(target) if target else "?"
-        elif has_link and not healthy:
-            junction_str = "[red]broken[/red]"
-            target = link_target(link_path)
-            target_str = f"[red]{target}[/red]" if target else "[red]?[/red]"
-        else:
-            junction_str = "[red]missing[/red]"
-            target_str = "[dim]-[/dim]"
+        link = links.get(name, _NO_LINK)
 
-        # Check cache status
-        cache_version_path = cache_dir / name / version
-        if cache_version_path.exists():
-            cache_str = "[green]ok[/green]"
+        if link.is_link and link.target_exists:
+            junction_str = _JUNCTION_OK
+            target_str = str(link.target) if link.target else "?"
+        elif link.is_link:
+            junction_str = _JUNCTION_BROKEN
+            target_str = f"[red]{link.target}[/red]" if link.target else _UNKNOWN_TARGET
         else:
-            cache_str = "[red]missing[/red]"
+            junction_str = _JUNCTION_MISSING
+            target_str = _DASH
+
+        cached = name in cached_names and fast_exists(f"{cache_root}{sep}{name}{sep}{version}")
 
-        table.add_row(name, version, enabled_str, junction_str, cache_str, target_str)
+        table.add_row(
+            name,
+            version,
+            _ENABLED_CELL[name in enabled_names],
+            junction_str,
+            _CACHE_CELL[cached],
+            target_str,
+        )
 
-    console.print(table)
+    console().print(table)
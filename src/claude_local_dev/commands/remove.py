@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
 from claude_local_dev.cli import app
 import shutil
 
-from claude_local_dev.config import get_local_dev_cache_dir, get_local_dev_plugins_dir
+from claude_local_dev.config import paths
 from claude_local_dev.errors import JunctionError
 from claude_local_dev.junction import is_link, remove_link
-from claude_local_dev.registry import (
-    disable_plugin,
-    get_installed_plugin,
-    remove_installed_plugin,
-    remove_marketplace_plugin,
-)
+from claude_local_dev.registry import RegistryTransaction, get_installed_plugin
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def console() -> Console:
+    """Build the Rich console on first use rather than at import."""
+    from rich.console import Console
 
-console = Console()
+    return Console()
 
 
 @app.command()
@@ -26,42 +32,43 @@ def remove(
     plugin_name: str = typer.Argument(..., help="Name of the plugin to remove."),
 ) -> None:
     """Unregister a plugin: remove junction and clean up all registry entries."""
-    plugins_dir = get_local_dev_plugins_dir()
-    link_path = plugins_dir / plugin_name
+    dirs = paths()
+    link_path = dirs.plugins / plugin_name
 
     # Check if anything to remove
     has_junction = is_link(link_path)
     has_install = get_installed_plugin(plugin_name) is not None
 
     if not has_junction and not has_install:
-        console.print(f"[yellow]Plugin not found:[/yellow] {plugin_name}")
+        console().print(f"[yellow]Plugin not found:[/yellow] {plugin_name}")
         raise typer.Exit(code=1)
 
     # Clean registry first (safer: if junction removal fails, at least
     # the plugin is deregistered and won't load next session)
-    remove_installed_plugin(plugin_name)
-    remove_marketplace_plugin(plugin_name)
-    disable_plugin(plugin_name)
+    with RegistryTransaction() as tx:
+        tx.remove_installed(plugin_name)
+        tx.remove_marketplace(plugin_name)
+        tx.disable(plugin_name)
 
     # Remove marketplace junction
     if has_junction:
         try:
             remove_link(link_path)
-            console.print(f"  Junction removed: {link_path}")
+            console().print(f"  Junction removed: {link_path}")
         except JunctionError as e:
-            console.print(f"[red]Failed to remove junction:[/red] {e}")
+            console().print(f"[red]Failed to remove junction:[/red] {e}")
     elif link_path.exists():
-        console.print(
+        console().print(
             f"  [yellow]Warning:[/yellow] {link_path} exists but is not a junction"
         )
 
     # Remove cache entry
-    cache_dir = get_local_dev_cache_dir() / plugin_name
+    cache_dir = dirs.cache / plugin_name
     if cache_dir.exists():
         try:
             shutil.rmtree(cache_dir)
-            console.print(f"  Cache removed: {cache_dir}")
+            console().print(f"  Cache removed: {cache_dir}")
         except OSError as e:
-            console.print(f"  [yellow]Warning: cache cleanup failed:[/yellow] {e}")
+            console().print(f"  [yellow]Warning: cache cleanup failed:[/yellow] {e}")
 
-    console.print(f"[green]Plugin removed:[/green] {plugin_name}")
+    console().print(f"[green]Plugin removed:[/green] {plugin_name}")
@@ -2,111 +2,93 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
 from claude_local_dev.cli import app
-from claude_local_dev.config import get_local_dev_cache_dir, get_local_dev_plugins_dir, MARKETPLACE_NAME
-from claude_local_dev.junction import is_link, is_link_healthy, link_target
-from claude_local_dev.registry import (
-    is_marketplace_registered,
-    list_enabled_local_dev_plugins,
-    list_installed_local_dev_plugins,
-    read_marketplace_manifest,
-)
+from claude_local_dev.config import paths
+from claude_local_dev.junction import dir_names, fast_exists, scan_links
+from claude_local_dev.registry import snapshot
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def console() -> Console:
+    """Build the Rich console on first use rather than at import."""
+    from rich.console import Console
+
+    return Console()
+
 
-console = Console()
+# Issue templates, formatted only when there is something to report
+_ISSUE_MESSAGES = {
+    "not-registered": "Marketplace 'local-dev' not registered in known_marketplaces.json",
+    "enabled-not-installed": (
+        "{name}: enabled in settings.json but missing from installed_plugins.json"
+    ),
+    "installed-not-enabled": (
+        "{name}: in installed_plugins.json but not enabled in settings.json"
+    ),
+    "no-junction": "{name}: registered but no junction in {detail}",
+    "unregistered-junction": "{name}: junction exists but not in installed_plugins.json",
+    "broken-junction": "{name}: junction target missing or inaccessible ({detail})",
+    "not-in-manifest": "{name}: installed but missing from marketplace.json catalog",
+    "no-cache": "{name}: no cache entry at {detail}",
+}
+_ISSUE_ORDER = {code: i for i, code in enumerate(_ISSUE_MESSAGES)}
 
 
 @app.command()
 def verify() -> None:
     """Cross-reference all registry files and report mismatches."""
-    issues: list[str] = []
-
-    # Check marketplace registration
-    if not is_marketplace_registered():
-        issues.append("Marketplace 'local-dev' not registered in known_marketplaces.json")
-
-    # Gather data from each source
-    enabled_names = set(list_enabled_local_dev_plugins())
-    installed_names = set(list_installed_local_dev_plugins().keys())
-    plugins_dir = get_local_dev_plugins_dir()
-
-    # Scan junction directory
-    junction_names: set[str] = set()
-    if plugins_dir.exists():
-        for entry in plugins_dir.iterdir():
-            if is_link(entry):
-                junction_names.add(entry.name)
-
-    # Read marketplace manifest
-    manifest = read_marketplace_manifest()
-    manifest_names = {p["name"] for p in manifest.get("plugins", []) if "name" in p}
-
-    # Cache directory
-    cache_dir = get_local_dev_cache_dir()
-
-    all_names = enabled_names | installed_names | junction_names | manifest_names
-
-    for name in sorted(all_names):
-        link_path = plugins_dir / name
-
-        # Check: enabled but not installed
-        if name in enabled_names and name not in installed_names:
-            issues.append(
-                f"{name}: enabled in settings.json but missing from installed_plugins.json"
-            )
-
-        # Check: installed but not enabled
-        if name in installed_names and name not in enabled_names:
-            issues.append(
-                f"{name}: in installed_plugins.json but not enabled in settings.json"
-            )
-
-        # Check: registry entry but no junction
-        if (name in enabled_names or name in installed_names) and name not in junction_names:
-            issues.append(
-                f"{name}: registered but no junction in {plugins_dir}"
-            )
-
-        # Check: junction but no registry entry
-        if name in junction_names and name not in installed_names:
-            issues.append(
-                f"{name}: junction exists but not in installed_plugins.json"
-            )
-
-        # Check: broken junction
-        if name in junction_names:
-            if not is_link_healthy(link_path):
-                target = link_target(link_path)
-                issues.append(
-                    f"{name}: junction target missing or inaccessible ({target})"
-                )
-
-        # Check: not in marketplace manifest
-        if name in installed_names and name not in manifest_names:
-            issues.append(
-                f"{name}: installed but missing from marketplace.json catalog"
-            )
-
-        # Check: missing cache entry
-        if name in installed_names:
-            installed = list_installed_local_dev_plugins().get(name, [{}])
-            version = installed[0].get("version", "1.0.0") if installed else "1.0.0"
-            cache_path = cache_dir / name / version
-            if not cache_path.exists():
-                issues.append(
-                    f"{name}: no cache entry at {cache_path}"
-                )
+    # Load each source exactly once; the checks below are set arithmetic
+    snap = snapshot()
+    dirs = paths()
+    plugins_dir = dirs.plugins
+
+    # Scan junction directory once; link health comes from the same pass
+    links = scan_links(plugins_dir)
+    junctions = frozenset(name for name, info in links.items() if info.is_link)
+    registered = snap.enabled | snap.installed
+
+    # (code, name, detail) — see _ISSUE_MESSAGES
+    issues: list[tuple[str, str, object]] = []
+    if not snap.registered:
+        issues.append(("not-registered", "", None))
+    issues += [("enabled-not-installed", n, None) for n in snap.enabled - snap.installed]
+    issues += [("installed-not-enabled", n, None) for n in snap.installed - snap.enabled]
+    issues += [("no-junction", n, plugins_dir) for n in registered - junctions]
+    issues += [("unregistered-junction", n, None) for n in junctions - snap.installed]
+    issues += [
+        ("broken-junction", n, links[n].target)
+        for n in junctions
+        if not links[n].target_exists
+    ]
+    issues += [("not-in-manifest", n, None) for n in snap.installed - snap.manifest]
+    # One listing of the cache root settles most plugins without a stat
+    cached_names = dir_names(dirs.cache)
+    for name, version in snap.versions.items():
+        cache_path = dirs.cache / name / version
+        if name not in cached_names or not fast_exists(cache_path):
+            issues.append(("no-cache", name, cache_path))
+
+    # Group by plugin, checks in _ISSUE_MESSAGES order
+    issues.sort(key=lambda issue: (issue[1], _ISSUE_ORDER[issue[0]]))
+    all_names = registered | junctions | snap.manifest
 
     # Report
     if issues:
-        console.print(f"[red]Found {len(issues)} issue(s):[/red]")
-        for issue in issues:
-            console.print(f"  [yellow]![/yellow] {issue}")
+        console().print(f"[red]Found {len(issues)} issue(s):[/red]")
+        for code, name, detail in issues:
+            message = _ISSUE_MESSAGES[code].format(name=name, detail=detail)
+            console().print(f"  [yellow]![/yellow] {message}")
         raise typer.Exit(code=1)
     else:
         n = len(all_names)
-        console.print(
+        console().print(
             f"[green]No issues found.[/green] {n} plugin(s) verified."
         )
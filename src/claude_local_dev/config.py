@@ -2,17 +2,33 @@
 
 All file paths flow from CLAUDE_CONFIG_DIR, which defaults to ~/.claude
 but can be overridden via environment variable for testing.
+
+Paths are computed once per process and cached; tests that change
+CLAUDE_CONFIG_DIR must call _reset_path_cache() afterwards.
 """
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 IS_WINDOWS = platform.system() == "Windows"
 
 
+def _join(base: Path, *parts: str) -> Path:
+    """Append constant segments to base as one string, parsing a single Path.
+
+    Cheaper than chaining `/`, which builds and normalizes an intermediate
+    PurePath per segment; the segments here are fixed names, never user input.
+    """
+    return Path(os.sep.join((str(base), *parts)))
+
+
+@functools.cache
 def get_claude_config_dir() -> Path:
     """Return the Claude configuration directory.
 
@@ -22,49 +38,95 @@ def get_claude_config_dir() -> Path:
     override = os.environ.get("CLAUDE_CONFIG_DIR")
     if override:
         return Path(override)
-    return Path.home() / ".claude"
+    return _join(Path.home(), ".claude")
 
 
+@functools.cache
 def get_plugins_dir() -> Path:
-    return get_claude_config_dir() / "plugins"
+    return _join(get_claude_config_dir(), "plugins")
 
 
+@functools.cache
 def get_marketplaces_dir() -> Path:
-    return get_plugins_dir() / "marketplaces"
+    return _join(get_plugins_dir(), "marketplaces")
 
 
+@functools.cache
 def get_local_dev_dir() -> Path:
-    return get_marketplaces_dir() / "local-dev"
+    return _join(get_marketplaces_dir(), "local-dev")
 
 
+@functools.cache
 def get_local_dev_plugins_dir() -> Path:
-    return get_local_dev_dir() / "plugins"
+    return _join(get_local_dev_dir(), "plugins")
 
 
 # JSON file paths
 
+@functools.cache
 def get_settings_path() -> Path:
-    return get_claude_config_dir() / "settings.json"
+    return _join(get_claude_config_dir(), "settings.json")
 
 
+@functools.cache
 def get_installed_plugins_path() -> Path:
-    return get_plugins_dir() / "installed_plugins.json"
+    return _join(get_plugins_dir(), "installed_plugins.json")
 
 
+@functools.cache
 def get_known_marketplaces_path() -> Path:
-    return get_plugins_dir() / "known_marketplaces.json"
+    return _join(get_plugins_dir(), "known_marketplaces.json")
 
 
+@functools.cache
 def get_marketplace_json_path() -> Path:
-    return get_local_dev_dir() / ".claude-plugin" / "marketplace.json"
+    return _join(get_local_dev_dir(), ".claude-plugin", "marketplace.json")
 
 
+@functools.cache
 def get_cache_dir() -> Path:
-    return get_plugins_dir() / "cache"
+    return _join(get_plugins_dir(), "cache")
 
 
+@functools.cache
 def get_local_dev_cache_dir() -> Path:
-    return get_cache_dir() / "local-dev"
+    return _join(get_cache_dir(), "local-dev")
+
 
+@functools.cache
+def paths() -> SimpleNamespace:
+    """The local-dev directories commands work with, resolved together once.
 
-MARKETPLACE_NAME = "local-dev"
+    Attributes: marketplace (local-dev dir), plugins (junction dir),
+    cache (local-dev plugin cache dir).
+    """
+    return SimpleNamespace(
+        marketplace=get_local_dev_dir(),
+        plugins=get_local_dev_plugins_dir(),
+        cache=get_local_dev_cache_dir(),
+    )
+
+
+_CACHED_GETTERS = (
+    get_claude_config_dir,
+    get_plugins_dir,
+    get_marketplaces_dir,
+    get_local_dev_dir,
+    get_local_dev_plugins_dir,
+    get_settings_path,
+    get_installed_plugins_path,
+    get_known_marketplaces_path,
+    get_marketplace_json_path,
+    get_cache_dir,
+    get_local_dev_cache_dir,
+    paths,
+)
+
+
+def _reset_path_cache() -> None:
+    """Drop cached paths so a changed CLAUDE_CONFIG_DIR takes effect."""
+    for getter in _CACHED_GETTERS:
+        getter.cache_clear()
+
+
+MARKETPLACE_NAME = sys.intern("local-dev")  # "-" keeps the literal from auto-interning
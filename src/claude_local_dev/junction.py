@@ -1,34 +1,63 @@
 """Cross-platform filesystem link operations.
 
-Windows: NTFS junctions (via mklink /J) — no admin rights needed.
+Windows: NTFS junctions (via DeviceIoControl, falling back to mklink /J)
+— no admin rights needed.
 Unix: Symlinks (os.symlink).
 """
 
 from __future__ import annotations
 
+import errno
+import functools
 import os
+import stat
+import struct
 import subprocess
+import sys
 from pathlib import Path
+from typing import Any, Callable, NamedTuple
 
 from claude_local_dev.config import IS_WINDOWS
 from claude_local_dev.errors import BrokenJunction, JunctionError
 
 
+def ensure_dir(path: Path) -> None:
+    """Create a directory and its parents unless it is already there.
+
+    The common already-exists case costs a single lstat.
+    """
+    st = _lstat_or_none(path)
+    if st is not None and stat.S_ISDIR(st.st_mode):
+        return
+    os.makedirs(path, exist_ok=True)
+
+
+def _lstat_or_none(path: Path) -> os.stat_result | None:
+    """lstat a path in one syscall; None if nothing (not even a dangling link) is there."""
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def create_link(link_path: Path, target_path: Path) -> None:
     """Create a junction (Windows) or symlink (Unix) pointing link_path -> target_path.
 
     Raises JunctionError if the operation fails.
     """
     target_path = target_path.resolve()
-    if not target_path.exists():
-        raise JunctionError(f"Target does not exist: {target_path}")
+    try:
+        target_st = os.stat(target_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise JunctionError(f"Target does not exist: {target_path}") from None
 
-    link_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(link_path.parent)
 
-    if link_path.exists() or link_path.is_symlink():
-        # If it already points to the right place, we're done
+    if _lstat_or_none(link_path) is not None:
+        # If it already leads to the same directory (same device and inode),
+        # we're done — no path normalization or chain walking needed
         try:
-            if link_path.resolve() == target_path:
+            if os.path.samestat(os.stat(link_path), target_st):
                 return
         except OSError:
             pass
@@ -42,7 +71,7 @@ def create_link(link_path: Path, target_path: Path) -> None:
 
 def remove_link(link_path: Path) -> None:
     """Remove a junction or symlink. Does nothing if it doesn't exist."""
-    if not link_path.exists() and not link_path.is_symlink():
+    if _lstat_or_none(link_path) is None:
         return
 
     if IS_WINDOWS:
@@ -53,11 +82,12 @@ def remove_link(link_path: Path) -> None:
 
 def is_link(path: Path) -> bool:
     """Check if a path is a junction (Windows) or symlink."""
-    if not path.exists() and not path.is_symlink():
+    st = _lstat_or_none(path)
+    if st is None:
         return False
     if IS_WINDOWS:
         return _is_junction_windows(path)
-    return path.is_symlink()
+    return stat.S_ISLNK(st.st_mode)
 
 
 def link_target(path: Path) -> Path | None:
@@ -75,17 +105,238 @@ def is_link_healthy(path: Path) -> bool:
     target = link_target(path)
     if target is None:
         return False
-    return target.exists()
+    return fast_exists(target)
+
+
+def fast_exists(path: str | Path) -> bool:
+    """Check that a path exists (following links) from cached metadata only.
+
+    On Linux this is a statx(AT_STATX_DONT_SYNC, STATX_TYPE) call, which
+    never forces a sync with a network filesystem. Elsewhere, or when
+    statx fails for any reason other than a missing path (ENOSYS on old
+    kernels, EPERM under seccomp sandboxes), it is os.path.exists.
+    """
+    probe = _load_statx()
+    if probe is not None:
+        err = probe(os.fsencode(path))
+        if err == 0:
+            return True
+        if err in (errno.ENOENT, errno.ENOTDIR):
+            return False
+    return os.path.exists(path)
+
+
+# --- Linux: statx ---
+
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_BUF_SIZE = 256  # sizeof(struct statx)
+
+
+@functools.cache
+def _load_statx() -> Callable[[bytes], int] | None:
+    """Bind libc statx once; the probe returns 0 or the errno of the call."""
+    if sys.platform != "linux":
+        return None
+    try:
+        import ctypes
+
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (ImportError, AttributeError, OSError):
+        return None  # glibc < 2.28 or a libc without statx
+    statx.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p,
+    ]
+    statx.restype = ctypes.c_int
+    buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+
+    def probe(path: bytes) -> int:
+        if statx(_AT_FDCWD, path, _AT_STATX_DONT_SYNC, _STATX_TYPE, buf) == 0:
+            return 0
+        return ctypes.get_errno()
+
+    return probe
+
+
+class LinkInfo(NamedTuple):
+    """Link state of one directory entry, as collected by scan_links()."""
+    is_link: bool
+    target: Path | None
+    target_exists: bool
+
+
+def scan_links(directory: Path) -> dict[str, LinkInfo]:
+    """Collect link state for every entry in a directory with one scandir pass.
+
+    Replaces per-name is_link / is_link_healthy / link_target calls: the
+    link type comes from the dirent, leaving one readlink and one stat
+    per link.
+    """
+    links: dict[str, LinkInfo] = {}
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return links
+    with entries:
+        for entry in entries:
+            if IS_WINDOWS:
+                linked = entry.is_symlink() or _is_junction_windows(Path(entry.path))
+            else:
+                linked = entry.is_symlink()
+            if not linked:
+                links[entry.name] = LinkInfo(False, None, False)
+                continue
+            target = link_target(Path(entry.path))
+            exists = target is not None and fast_exists(Path(entry.path))
+            links[entry.name] = LinkInfo(True, target, exists)
+    return links
+
+
+def dir_names(directory: Path) -> frozenset[str]:
+    """Names of the entries in a directory; empty if it does not exist.
+
+    One scandir call, so callers can rule out missing entries in memory
+    before stat-ing any of them.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
 
 
 # --- Windows: NTFS Junctions ---
 
 
+# Win32 constants for building junctions without spawning cmd.exe
+_GENERIC_WRITE = 0x40000000
+_OPEN_EXISTING = 3
+_FILE_FLAG_OPEN_REPARSE_POINT = 0x00200000
+_FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+_FSCTL_SET_REPARSE_POINT = 0x000900A4
+_IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+
+
+@functools.cache
+def _load_kernel32() -> Any:
+    """Load kernel32 with prototypes for the junction calls, or None if unavailable."""
+    # sys.platform, not IS_WINDOWS: type checkers only narrow on the former,
+    # and the Windows-only ctypes names below don't exist elsewhere
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except (ImportError, AttributeError, OSError):
+        return None
+
+    kernel32.CreateDirectoryW.argtypes = [wintypes.LPCWSTR, wintypes.LPVOID]
+    kernel32.CreateDirectoryW.restype = wintypes.BOOL
+    kernel32.RemoveDirectoryW.argtypes = [wintypes.LPCWSTR]
+    kernel32.RemoveDirectoryW.restype = wintypes.BOOL
+    kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.DeviceIoControl.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+        wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+        wintypes.LPVOID,
+    ]
+    kernel32.DeviceIoControl.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
+
+def _win_error(action: str) -> JunctionError:
+    if sys.platform != "win32":
+        return JunctionError(f"{action} failed")
+    import ctypes
+
+    code = ctypes.get_last_error()
+    return JunctionError(f"{action} failed: {ctypes.FormatError(code).strip()}")
+
+
+def _mount_point_buffer(target_path: Path) -> bytes:
+    """Build a REPARSE_DATA_BUFFER for an IO_REPARSE_TAG_MOUNT_POINT."""
+    target = str(target_path)
+    if target.startswith("\\\\?\\"):
+        target = target[4:]
+    substitute = ("\\??\\" + target).encode("utf-16-le")
+    printable = target.encode("utf-16-le")
+    # PathBuffer holds both names, each NUL-terminated
+    path_buffer = substitute + b"\0\0" + printable + b"\0\0"
+    header = struct.pack(
+        "<LHHHHHH",
+        _IO_REPARSE_TAG_MOUNT_POINT,
+        8 + len(path_buffer),  # ReparseDataLength: offsets/lengths + PathBuffer
+        0,
+        0,
+        len(substitute),
+        len(substitute) + 2,
+        len(printable),
+    )
+    return header + path_buffer
+
+
+def _open_reparse_point(kernel32: Any, link_path: Path) -> Any:
+    import ctypes
+
+    handle = kernel32.CreateFileW(
+        str(link_path),
+        _GENERIC_WRITE,
+        0,
+        None,
+        _OPEN_EXISTING,
+        _FILE_FLAG_OPEN_REPARSE_POINT | _FILE_FLAG_BACKUP_SEMANTICS,
+        None,
+    )
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        raise _win_error("CreateFileW")
+    return handle
+
+
+def _device_io_control(kernel32: Any, handle: Any, code: int, buf: bytes) -> bool:
+    import ctypes
+    from ctypes import wintypes
+
+    returned = wintypes.DWORD(0)
+    return bool(kernel32.DeviceIoControl(
+        handle, code, buf, len(buf), None, 0, ctypes.byref(returned), None,
+    ))
+
+
+def _create_junction_native(kernel32: Any, link_path: Path, target_path: Path) -> None:
+    """Create an NTFS junction in-process: CreateDirectoryW + FSCTL_SET_REPARSE_POINT."""
+    if not kernel32.CreateDirectoryW(str(link_path), None):
+        raise _win_error("CreateDirectoryW")
+    try:
+        handle = _open_reparse_point(kernel32, link_path)
+        try:
+            buf = _mount_point_buffer(target_path)
+            if not _device_io_control(kernel32, handle, _FSCTL_SET_REPARSE_POINT, buf):
+                raise _win_error("FSCTL_SET_REPARSE_POINT")
+        finally:
+            kernel32.CloseHandle(handle)
+    except JunctionError:
+        # Don't leave an empty directory behind where the junction should be
+        kernel32.RemoveDirectoryW(str(link_path))
+        raise
+
+
 def _create_junction_windows(link_path: Path, target_path: Path) -> None:
+    kernel32 = _load_kernel32()
+    if kernel32 is not None:
+        _create_junction_native(kernel32, link_path, target_path)
+        return
     try:
-        # Python 3.12+ on Windows: os.symlink for directories
-        # creates a junction-like structure. But mklink /J is more reliable
-        # for NTFS junctions specifically.
+        # Fallback when ctypes can't reach kernel32: mklink /J via cmd.exe
         result = subprocess.run(
             ["cmd", "/c", "mklink", "/J", str(link_path), str(target_path)],
             capture_output=True,
@@ -101,21 +352,12 @@ def _create_junction_windows(link_path: Path, target_path: Path) -> None:
 
 
 def _remove_junction_windows(link_path: Path) -> None:
+    # A junction is a directory reparse point: rmdir removes the link
+    # itself and never touches the target's contents
     try:
-        # Junctions on Windows are directories; rmdir removes the link
-        # without affecting the target
-        result = subprocess.run(
-            ["cmd", "/c", "rmdir", str(link_path)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            raise JunctionError(
-                f"rmdir failed: {result.stderr.strip() or result.stdout.strip()}"
-            )
-    except FileNotFoundError:
-        raise JunctionError("cmd.exe not found — cannot remove junction")
+        os.rmdir(link_path)
+    except OSError as e:
+        raise JunctionError(f"rmdir failed: {e}") from e
 
 
 def _is_junction_windows(path: Path) -> bool:
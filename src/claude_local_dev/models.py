@@ -1,4 +1,4 @@
-"""Pydantic v2 models for the three JSON file schemas.
+"""Plain dataclasses for the three JSON file schemas.
 
 These model ONLY the structures we need to read/write.
 settings.json is handled as raw dict (we only touch enabledPlugins).
@@ -6,25 +6,24 @@ settings.json is handled as raw dict (we only touch enabledPlugins).
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 # --- installed_plugins.json ---
 
-class PluginInstallRecord(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PluginInstallRecord:
     """A single install record for a plugin."""
     scope: str = "project"
-    install_path: str = Field(alias="installPath")
+    install_path: str
     version: str = "1.0.0"
-    installed_at: str = Field(alias="installedAt")
-    last_updated: str = Field(alias="lastUpdated")
-    git_commit_sha: str | None = Field(default=None, alias="gitCommitSha")
-    project_path: str = Field(alias="projectPath")
-
-    model_config = {"populate_by_name": True}
+    installed_at: str
+    last_updated: str
+    git_commit_sha: str | None = None
+    project_path: str
 
     def to_json_dict(self) -> dict[str, Any]:
         """Serialize using the camelCase aliases for JSON output."""
@@ -41,37 +40,43 @@ class PluginInstallRecord(BaseModel):
         return d
 
 
-class InstalledPluginsFile(BaseModel):
+@dataclass(slots=True)
+class InstalledPluginsFile:
     """Top-level structure of installed_plugins.json."""
     version: int = 2
-    plugins: dict[str, list[PluginInstallRecord]] = Field(default_factory=dict)
+    plugins: dict[str, list[PluginInstallRecord]] = field(default_factory=dict)
 
 
 # --- known_marketplaces.json ---
 
-class MarketplaceSource(BaseModel):
+@dataclass(slots=True)
+class MarketplaceSource:
     """Source descriptor for a marketplace."""
     source: str  # "github" or "directory"
     repo: str | None = None
     path: str | None = None
 
+    def to_json_dict(self) -> dict[str, Any]:
+        """Serialize, omitting unset optional fields."""
+        d: dict[str, Any] = {"source": self.source}
+        if self.repo is not None:
+            d["repo"] = self.repo
+        if self.path is not None:
+            d["path"] = self.path
+        return d
 
-class MarketplaceEntry(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class MarketplaceEntry:
     """A single marketplace entry."""
     source: MarketplaceSource
-    install_location: str = Field(alias="installLocation")
-    last_updated: str = Field(alias="lastUpdated")
-
-    model_config = {"populate_by_name": True}
+    install_location: str
+    last_updated: str
 
     def to_json_dict(self) -> dict[str, Any]:
-        source_dict: dict[str, Any] = {"source": self.source.source}
-        if self.source.repo is not None:
-            source_dict["repo"] = self.source.repo
-        if self.source.path is not None:
-            source_dict["path"] = self.source.path
+        """Serialize using the camelCase aliases for JSON output."""
         return {
-            "source": source_dict,
+            "source": self.source.to_json_dict(),
             "installLocation": self.install_location,
             "lastUpdated": self.last_updated,
         }
@@ -79,32 +84,54 @@ class MarketplaceEntry(BaseModel):
 
 # --- Factory helpers ---
 
+def utcnow_iso() -> str:
+    """Current UTC time as e.g. 2026-01-01T00:00:00.000Z."""
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.000Z"
+    )
+
+
 def make_install_record(
     plugin_name: str,
     install_path: str,
     version: str = "1.0.0",
     project_path: str | None = None,
-) -> PluginInstallRecord:
-    """Create a new PluginInstallRecord with current timestamp."""
-    from pathlib import Path
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    *,
+    now: str | None = None,
+) -> dict[str, Any]:
+    """Create a new install record, as its JSON dict, with current timestamp.
+
+    Same shape as PluginInstallRecord.to_json_dict(), built directly.
+    now overrides the timestamp (see utcnow_iso) so several records can
+    share one.
+    """
+    if now is None:
+        now = utcnow_iso()
     if project_path is None:
         project_path = str(Path.home())
-    return PluginInstallRecord(
-        scope="project",
-        installPath=install_path,
-        version=version,
-        installedAt=now,
-        lastUpdated=now,
-        projectPath=project_path,
-    )
-
-
-def make_local_dev_marketplace(install_location: str) -> MarketplaceEntry:
-    """Create a MarketplaceEntry for the local-dev marketplace."""
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
-    return MarketplaceEntry(
-        source=MarketplaceSource(source="directory", path=install_location),
-        installLocation=install_location,
-        lastUpdated=now,
-    )
+    return {
+        "scope": "project",
+        "installPath": install_path,
+        "version": version,
+        "installedAt": now,
+        "lastUpdated": now,
+        "projectPath": project_path,
+    }
+
+
+def make_local_dev_marketplace(
+    install_location: str, *, now: str | None = None
+) -> dict[str, Any]:
+    """Create the local-dev marketplace entry, as its JSON dict.
+
+    Same shape as MarketplaceEntry.to_json_dict(), built directly.
+    """
+    if now is None:
+        now = utcnow_iso()
+    return {
+        "source": {"source": "directory", "path": install_location},
+        "installLocation": install_location,
+        "lastUpdated": now,
+    }
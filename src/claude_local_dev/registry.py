@@ -7,9 +7,18 @@ entries). Everything else passes through untouched.
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
 import json
+import math
+import os
+import stat
+import string
+import sys
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, Callable, NamedTuple
 
 import re
 
@@ -22,107 +31,305 @@ from claude_local_dev.config import (
     get_marketplace_json_path,
     get_settings_path,
 )
-from claude_local_dev.errors import RegistryCorrupted
-from claude_local_dev.models import (
-    make_install_record,
-    make_local_dev_marketplace,
-)
+from claude_local_dev.errors import PluginNotFound, RegistryCorrupted
+
+try:  # optional C parser: pip install claude-local-dev[fast]
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson reads integers wider than 64 bits as floats. Any run of 19 digits
+# sends the file to the stdlib parser instead, which keeps them exact.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+class _NonFinite(float):
+    """A NaN, Infinity or overflowing literal, which only the stdlib parser reads.
+
+    Keeps the literal's original text so it is written back unchanged:
+    1e400 is valid JSON, the Infinity that json.dumps would emit is not.
+    orjson rejects float subclasses, which routes these to _dumps_stdlib.
+    """
+
+    text: str
+
+    def __new__(cls, text: str) -> _NonFinite:
+        self = super().__new__(cls, text)
+        self.text = text
+        return self
+
+
+def _parse_float(text: str) -> float:
+    value = float(text)
+    return value if math.isfinite(value) else _NonFinite(text)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson only where it reads every value exactly."""
+    if orjson is not None and _LONG_DIGITS.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN, Infinity or a lone surrogate: _dumps_stdlib writes them back
+    return json.loads(raw, parse_constant=_NonFinite, parse_float=_parse_float)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize as UTF-8 with 2-space indent and a trailing newline."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            pass  # wide integers, _NonFinite or lone surrogates
+    return _dumps_stdlib(data)
+
+
+def _dumps_stdlib(data: Any) -> bytes:
+    try:
+        return _dumps_text(data, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # A lone surrogate has no UTF-8 form; ensure_ascii writes it as \ud800
+        return _dumps_text(data, ensure_ascii=True).encode("ascii")
+
+
+def _dumps_text(data: Any, *, ensure_ascii: bool) -> str:
+    try:
+        text = json.dumps(data, indent=2, ensure_ascii=ensure_ascii, allow_nan=False)
+    except ValueError:
+        # Non-finite floats: swap each _NonFinite for a marker string, then
+        # put its original literal back in place of the quoted marker
+        literals: dict[str, str] = {}
+        text = json.dumps(
+            _mark_literals(data, literals, os.urandom(8).hex()),
+            indent=2,
+            ensure_ascii=ensure_ascii,
+        )
+        for marker, literal in literals.items():
+            text = text.replace(f'"{marker}"', literal)
+    return text + "\n"
+
+
+def _mark_literals(value: Any, literals: dict[str, str], prefix: str) -> Any:
+    """Copy value with every _NonFinite replaced by a marker recorded in literals."""
+    if isinstance(value, _NonFinite):
+        marker = f"{prefix}-{len(literals)}"
+        literals[marker] = value.text
+        return marker
+    if isinstance(value, dict):
+        return {k: _mark_literals(v, literals, prefix) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_mark_literals(v, literals, prefix) for v in value]
+    return value
+
 
 # Plugin names must be safe for filesystem use and registry keys
-_VALID_PLUGIN_NAME = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$")
+_VALID_PLUGIN_NAME = re.compile(r"\A[a-zA-Z0-9][a-zA-Z0-9._-]*\Z")
+_NAME_FIRST = frozenset(string.ascii_letters + string.digits)
+_NAME_CHARS = _NAME_FIRST | frozenset("._-")
+
+
+# path -> (st_mtime_ns, st_size, parsed value); see _stat_cached
+_parse_cache: dict[Path, tuple[int, int, Any]] = {}
+
+
+def _stat_cached(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """Return loader(path), reusing the last result while mtime and size are unchanged.
+
+    Size catches a rewrite that lands within the filesystem's mtime
+    granularity. Raises FileNotFoundError if path does not exist.
+    """
+    st = os.stat(path)
+    hit = _parse_cache.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    value = loader(path)
+    _parse_cache[path] = (st.st_mtime_ns, st.st_size, value)
+    return value
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    """Read a JSON file, returning empty dict if missing or empty."""
-    if not path.exists():
+    """Read a JSON file, returning empty dict if missing or empty.
+
+    Parsed contents are cached until the file's mtime or size changes. The dict is
+    shared with the cache: only mutate it on the way to _write_json. Public
+    readers hand out deep copies instead.
+    """
+    try:
+        return _stat_cached(path, _load_json)
+    except FileNotFoundError:
         return {}
-    text = path.read_text(encoding="utf-8").strip()
-    if not text:
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    raw = path.read_bytes()
+    if not raw or raw.isspace():  # no copy, unlike strip(); stops at first non-space
         return {}
+    # Anything that can't open a JSON container is rejected without parsing
+    head = raw[:1]
+    if head.isspace():
+        head = raw.lstrip()[:1]
+    if head not in (b"{", b"["):
+        raise RegistryCorrupted(f"{path}: not a JSON object (starts with {head!r})")
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as e:
+        return _loads(raw)
+    except ValueError as e:  # JSONDecodeError (either parser) or bad UTF-8
         raise RegistryCorrupted(f"{path}: {e}") from e
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
     """Write a JSON file with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Drop the cached parse: it may be the dict being written, mutated in
+    # place. The next read, if there is one, parses the new file.
+    _parse_cache.pop(path, None)
+    _atomic_write_bytes(path, _dumps(data))
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace path's contents with data in one rename.
+
+    The bytes go to a sibling temp file first, so readers (including
+    Claude Code itself) never see a half-written registry. The pid in its
+    name keeps two concurrent writers from sharing a temp file. No fsync:
+    the rename gives atomic visibility, which is what readers need.
+
+    A symlinked path is resolved first, so the link survives and its
+    target is what gets replaced; the existing file's permission bits
+    carry over to the new one. If path already holds exactly data,
+    nothing is written.
+    """
+    real = os.path.realpath(path)
+    mode = None
+    try:
+        with open(real, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == len(data) and f.read() == data:
+                return
+        mode = stat.S_IMODE(st.st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    tmp = Path(f"{real}.tmp.{os.getpid()}")
+    try:
+        try:
+            tmp.write_bytes(data)
+        except FileNotFoundError:
+            # Only the first write into a fresh config dir pays for mkdir
+            tmp.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, real)
+    except OSError:
+        # Never leave a partial temp file behind (ENOSPC, EIO, failed rename)
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def validate_plugin_name(name: str) -> None:
     """Validate a plugin name is safe for filesystem and registry use."""
     if not name:
         raise ValueError("Plugin name cannot be empty")
-    if not _VALID_PLUGIN_NAME.match(name):
-        raise ValueError(
-            f"Invalid plugin name: {name!r} "
-            f"(must match {_VALID_PLUGIN_NAME.pattern})"
-        )
+    # Same rule as _VALID_PLUGIN_NAME, checked without the regex engine;
+    # issuperset walks the string in C
+    if name[0] in _NAME_FIRST and _NAME_CHARS.issuperset(name):
+        return
+    raise ValueError(
+        f"Invalid plugin name: {name!r} "
+        f"(must match {_VALID_PLUGIN_NAME.pattern})"
+    )
+
+
+_SUFFIX = sys.intern(f"@{MARKETPLACE_NAME}")
+_SUFFIX_LEN = len(_SUFFIX)
+
+# pop() default for removals: a JSON null value still counts as present
+_MISSING = object()
 
 
 def _plugin_key(plugin_name: str) -> str:
-    """Build the composite key: name@local-dev."""
-    return f"{plugin_name}@{MARKETPLACE_NAME}"
+    """Build the composite key: name@local-dev.
+
+    Interned, so a key stored by one mutation and looked up by the next
+    in the same process matches by identity without a string compare.
+    """
+    return sys.intern(plugin_name + _SUFFIX)
+
+
+def _in_transaction(
+    tx: RegistryTransaction | None,
+) -> contextlib.AbstractContextManager[RegistryTransaction]:
+    """Join tx if given, otherwise run as a single-operation transaction."""
+    return contextlib.nullcontext(tx) if tx is not None else RegistryTransaction()
 
 
 # --- settings.json ---
 
 
-def read_settings() -> dict[str, Any]:
+def _settings() -> dict[str, Any]:
     return _read_json(get_settings_path())
 
 
+def read_settings() -> dict[str, Any]:
+    return copy.deepcopy(_settings())
+
+
 def write_settings(data: dict[str, Any]) -> None:
     _write_json(get_settings_path(), data)
 
 
-def enable_plugin(plugin_name: str) -> None:
+def enable_plugin(plugin_name: str, *, tx: RegistryTransaction | None = None) -> None:
     """Add plugin to enabledPlugins in settings.json. Preserves all other keys."""
-    data = read_settings()
+    with _in_transaction(tx) as t:
+        t.enable(plugin_name)
+
+
+def _enable(data: dict[str, Any], plugin_name: str) -> None:
     enabled = data.setdefault("enabledPlugins", {})
     enabled[_plugin_key(plugin_name)] = True
-    write_settings(data)
 
 
-def disable_plugin(plugin_name: str) -> None:
+def disable_plugin(plugin_name: str, *, tx: RegistryTransaction | None = None) -> None:
     """Remove plugin from enabledPlugins in settings.json. Preserves all other keys."""
-    data = read_settings()
+    with _in_transaction(tx) as t:
+        t.disable(plugin_name)
+
+
+def _disable(data: dict[str, Any], plugin_name: str) -> bool:
+    """Drop the plugin's enabledPlugins entry; True if there was one."""
     enabled = data.get("enabledPlugins", {})
-    key = _plugin_key(plugin_name)
-    if key in enabled:
-        del enabled[key]
-    write_settings(data)
+    return enabled.pop(_plugin_key(plugin_name), _MISSING) is not _MISSING
 
 
 def is_plugin_enabled(plugin_name: str) -> bool:
-    data = read_settings()
+    data = _settings()
     return data.get("enabledPlugins", {}).get(_plugin_key(plugin_name), False)
 
 
 def list_enabled_local_dev_plugins() -> list[str]:
     """Return names of all local-dev plugins that are enabled."""
-    data = read_settings()
+    data = _settings()
     enabled = data.get("enabledPlugins", {})
-    suffix = f"@{MARKETPLACE_NAME}"
+    # endswith first: most entries are enabled, few are ours
     return [
-        key.removesuffix(suffix)
-        for key in enabled
-        if key.endswith(suffix) and enabled[key]
+        key[:-_SUFFIX_LEN]
+        for key, on in enabled.items()
+        if key.endswith(_SUFFIX) and on
     ]
 
 
 # --- installed_plugins.json ---
 
 
-def read_installed_plugins() -> dict[str, Any]:
+def _installed_plugins() -> dict[str, Any]:
     return _read_json(get_installed_plugins_path())
 
 
+def read_installed_plugins() -> dict[str, Any]:
+    return copy.deepcopy(_installed_plugins())
+
+
 def write_installed_plugins(data: dict[str, Any]) -> None:
     _write_json(get_installed_plugins_path(), data)
 
@@ -132,104 +339,179 @@ def add_installed_plugin(
     install_path: str,
     version: str = "1.0.0",
     project_path: str | None = None,
+    *,
+    tx: RegistryTransaction | None = None,
 ) -> None:
     """Add a plugin install record. Preserves all other plugins."""
-    data = read_installed_plugins()
+    with _in_transaction(tx) as t:
+        t.add_installed(plugin_name, install_path, version, project_path)
+
+
+def _add_installed(
+    data: dict[str, Any],
+    plugin_name: str,
+    install_path: str,
+    version: str,
+    project_path: str | None,
+    now: str,
+) -> None:
+    from claude_local_dev.models import make_install_record  # write path only
+
     data.setdefault("version", 2)
     plugins = data.setdefault("plugins", {})
     key = _plugin_key(plugin_name)
-    record = make_install_record(
+    plugins[key] = [make_install_record(
         plugin_name=plugin_name,
         install_path=install_path,
         version=version,
         project_path=project_path,
-    )
-    plugins[key] = [record.to_json_dict()]
-    write_installed_plugins(data)
+        now=now,
+    )]
 
 
-def remove_installed_plugin(plugin_name: str) -> None:
+def remove_installed_plugin(
+    plugin_name: str, *, tx: RegistryTransaction | None = None
+) -> None:
     """Remove a plugin's install records. Preserves all other plugins."""
-    data = read_installed_plugins()
+    with _in_transaction(tx) as t:
+        t.remove_installed(plugin_name)
+
+
+def _remove_installed(data: dict[str, Any], plugin_name: str) -> bool:
+    """Drop the plugin's install records; True if there were any."""
     plugins = data.get("plugins", {})
-    key = _plugin_key(plugin_name)
-    if key in plugins:
-        del plugins[key]
-    write_installed_plugins(data)
+    return plugins.pop(_plugin_key(plugin_name), _MISSING) is not _MISSING
 
 
 def get_installed_plugin(plugin_name: str) -> list[dict[str, Any]] | None:
     """Get install records for a plugin, or None if not installed."""
-    data = read_installed_plugins()
-    return data.get("plugins", {}).get(_plugin_key(plugin_name))
+    records = _installed_plugins().get("plugins", {}).get(_plugin_key(plugin_name))
+    return copy.deepcopy(records)
 
 
 def list_installed_local_dev_plugins() -> dict[str, list[dict[str, Any]]]:
     """Return all local-dev plugin install records."""
-    data = read_installed_plugins()
-    plugins = data.get("plugins", {})
-    suffix = f"@{MARKETPLACE_NAME}"
-    return {
-        key.removesuffix(suffix): records
+    plugins = _installed_plugins().get("plugins", {})
+    return copy.deepcopy({
+        key[:-_SUFFIX_LEN]: records
         for key, records in plugins.items()
-        if key.endswith(suffix)
-    }
+        if key.endswith(_SUFFIX)
+    })
 
 
 # --- known_marketplaces.json ---
 
 
-def read_known_marketplaces() -> dict[str, Any]:
+def _known_marketplaces() -> dict[str, Any]:
     return _read_json(get_known_marketplaces_path())
 
 
+def read_known_marketplaces() -> dict[str, Any]:
+    return copy.deepcopy(_known_marketplaces())
+
+
 def write_known_marketplaces(data: dict[str, Any]) -> None:
     _write_json(get_known_marketplaces_path(), data)
 
 
-def register_marketplace() -> None:
-    """Register the local-dev marketplace. Preserves all other marketplaces."""
+def load_known_marketplaces() -> tuple[dict[str, Any], bool]:
+    """Read known_marketplaces.json once: (data, whether local-dev is registered).
+
+    Pass data on to register_marketplace(preloaded=...) to avoid a second read.
+    """
     data = read_known_marketplaces()
-    install_location = str(get_local_dev_dir())
-    entry = make_local_dev_marketplace(install_location)
-    data[MARKETPLACE_NAME] = entry.to_json_dict()
-    write_known_marketplaces(data)
+    return data, MARKETPLACE_NAME in data
+
+
+def register_marketplace(
+    preloaded: dict[str, Any] | None = None,
+    *,
+    tx: RegistryTransaction | None = None,
+) -> None:
+    """Register the local-dev marketplace. Preserves all other marketplaces.
+
+    preloaded is the known_marketplaces.json content if the caller has
+    already read it (see load_known_marketplaces).
+    """
+    with _in_transaction(tx) as t:
+        t.register(preloaded)
+
+
+def _register(data: dict[str, Any], now: str) -> None:
+    from claude_local_dev.models import make_local_dev_marketplace  # write path only
+
+    data[MARKETPLACE_NAME] = make_local_dev_marketplace(str(get_local_dev_dir()), now=now)
 
 
-def unregister_marketplace() -> None:
+def unregister_marketplace(*, tx: RegistryTransaction | None = None) -> None:
     """Remove the local-dev marketplace entry. Preserves all other marketplaces."""
-    data = read_known_marketplaces()
-    if MARKETPLACE_NAME in data:
-        del data[MARKETPLACE_NAME]
-    write_known_marketplaces(data)
+    with _in_transaction(tx) as t:
+        t.unregister()
 
 
 def is_marketplace_registered() -> bool:
-    data = read_known_marketplaces()
+    data = _known_marketplaces()
     return MARKETPLACE_NAME in data
 
 
 # --- Plugin metadata reading ---
 
 
-def read_plugin_json(plugin_path: Path) -> dict[str, Any]:
-    """Read the plugin.json from a plugin directory."""
+def read_plugin_json(plugin_path: Path, *, required: bool = False) -> dict[str, Any]:
+    """Read the plugin.json from a plugin directory.
+
+    A missing file yields {} unless required is set, in which case
+    PluginNotFound is raised. Parsed results are memoized by (path, mtime, size),
+    so the repeated lookups in a single command cost one stat instead of
+    an open and a parse.
+    """
     pj = plugin_path / ".claude-plugin" / "plugin.json"
-    if not pj.exists():
+    try:
+        st = os.stat(pj)
+    except (FileNotFoundError, NotADirectoryError):
+        if required:
+            raise PluginNotFound(f"{plugin_path}: missing .claude-plugin/plugin.json") from None
         return {}
-    return json.loads(pj.read_text(encoding="utf-8"))
+    return copy.deepcopy(_parse_plugin_json(str(pj), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_plugin_json(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse plugin.json; mtime_ns and size are only part of the cache key."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return _loads(raw) if raw else {}
+
+
+class PluginMeta(NamedTuple):
+    """The plugin.json fields commands need, with defaults applied."""
+    name: str
+    version: str
+    raw: dict[str, Any]
+
+
+def read_plugin_metadata(plugin_path: Path, *, required: bool = False) -> PluginMeta:
+    """Read plugin.json once and resolve name and version from it.
+
+    name falls back to the directory name, version to 1.0.0; raw is the
+    full plugin.json dict. required behaves as in read_plugin_json.
+    """
+    meta = read_plugin_json(plugin_path, required=required)
+    return PluginMeta(
+        meta.get("name") or plugin_path.name,
+        meta.get("version", "1.0.0"),
+        meta,
+    )
 
 
 def get_plugin_name(plugin_path: Path) -> str:
     """Extract the plugin name from its plugin.json, falling back to dir name."""
-    meta = read_plugin_json(plugin_path)
-    return meta.get("name") or plugin_path.name
+    return read_plugin_metadata(plugin_path).name
 
 
 def get_plugin_version(plugin_path: Path) -> str:
     """Extract the version from plugin.json, defaulting to 1.0.0."""
-    meta = read_plugin_json(plugin_path)
-    return meta.get("version", "1.0.0")
+    return read_plugin_metadata(plugin_path).version
 
 
 # --- marketplace.json (plugin catalog) ---
@@ -238,10 +520,10 @@ def get_plugin_version(plugin_path: Path) -> str:
 _MARKETPLACE_SCHEMA = "https://anthropic.com/claude-code/marketplace.schema.json"
 
 
-def read_marketplace_manifest() -> dict[str, Any]:
-    """Read the marketplace.json manifest, returning a default if missing."""
-    path = get_marketplace_json_path()
-    if not path.exists():
+def _marketplace_manifest() -> dict[str, Any]:
+    try:
+        return _stat_cached(get_marketplace_json_path(), _load_json)
+    except FileNotFoundError:
         return {
             "$schema": _MARKETPLACE_SCHEMA,
             "name": MARKETPLACE_NAME,
@@ -249,7 +531,11 @@ def read_marketplace_manifest() -> dict[str, Any]:
             "owner": {"name": ""},
             "plugins": [],
         }
-    return _read_json(path)
+
+
+def read_marketplace_manifest() -> dict[str, Any]:
+    """Read the marketplace.json manifest, returning a default if missing."""
+    return copy.deepcopy(_marketplace_manifest())
 
 
 def write_marketplace_manifest(data: dict[str, Any]) -> None:
@@ -261,9 +547,21 @@ def add_marketplace_plugin(
     description: str,
     version: str = "1.0.0",
     author_name: str = "",
+    *,
+    tx: RegistryTransaction | None = None,
 ) -> None:
     """Add or update a plugin entry in marketplace.json."""
-    data = read_marketplace_manifest()
+    with _in_transaction(tx) as t:
+        t.add_marketplace(plugin_name, description, version, author_name)
+
+
+def _add_marketplace_plugin(
+    data: dict[str, Any],
+    plugin_name: str,
+    description: str,
+    version: str,
+    author_name: str,
+) -> None:
     plugins = data.setdefault("plugins", [])
 
     # Remove existing entry if present
@@ -278,15 +576,206 @@ def add_marketplace_plugin(
         "category": "development",
     })
 
-    write_marketplace_manifest(data)
-
 
-def remove_marketplace_plugin(plugin_name: str) -> None:
+def remove_marketplace_plugin(
+    plugin_name: str, *, tx: RegistryTransaction | None = None
+) -> None:
     """Remove a plugin entry from marketplace.json."""
-    path = get_marketplace_json_path()
-    if not path.exists():
-        return
-    data = _read_json(path)
+    with _in_transaction(tx) as t:
+        t.remove_marketplace(plugin_name)
+
+
+def _remove_marketplace_plugin(data: dict[str, Any], plugin_name: str) -> bool:
+    """Drop the plugin's catalog entries; True if there were any."""
     plugins = data.get("plugins", [])
+    before = len(plugins)
     plugins[:] = [p for p in plugins if p.get("name") != plugin_name]
-    write_marketplace_manifest(data)
+    return len(plugins) != before
+
+
+# --- Snapshot ---
+
+
+class RegistrySnapshot(NamedTuple):
+    """Local-dev plugin names as seen by each registry file.
+
+    Cross-checks (as in verify) become set arithmetic, e.g.
+    snap.enabled - snap.installed.
+    """
+    registered: bool
+    enabled: frozenset[str]
+    installed: frozenset[str]
+    manifest: frozenset[str]
+    versions: dict[str, str]  # installed name -> recorded version
+
+
+def snapshot() -> RegistrySnapshot:
+    """Read every registry file once and collect local-dev names from each."""
+    versions = {
+        name: records[0].get("version", "1.0.0") if records else "1.0.0"
+        for name, records in list_installed_local_dev_plugins().items()
+    }
+    manifest = _marketplace_manifest().get("plugins", [])
+    return RegistrySnapshot(
+        registered=is_marketplace_registered(),
+        enabled=frozenset(list_enabled_local_dev_plugins()),
+        installed=frozenset(versions),
+        manifest=frozenset(p["name"] for p in manifest if "name" in p),
+        versions=versions,
+    )
+
+
+# --- Transactions ---
+
+
+class RegistryTransaction:
+    """Batch several registry mutations into one read and one write per file.
+
+    Each file is loaded the first time a mutation needs it and written
+    once, in first-touched order, when the block exits cleanly. If the
+    block raises, nothing is written.
+
+        with RegistryTransaction() as tx:
+            tx.add_installed(name, install_path, version)
+            tx.add_marketplace(name, description, version, author)
+            tx.enable(name)
+
+    Commands use the methods. The module-level mutators join a
+    transaction passed as tx=; without it each one runs as its own
+    single-operation transaction.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: dict[Path, dict[str, Any]] = {}
+        self._dirty: dict[Path, None] = {}  # insertion-ordered set
+        self._now: str | None = None
+
+    def __enter__(self) -> RegistryTransaction:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def now(self) -> str:
+        """The timestamp every entry written by this transaction shares."""
+        if self._now is None:
+            from claude_local_dev.models import utcnow_iso
+
+            self._now = utcnow_iso()
+        return self._now
+
+    def _load(self, path: Path, reader: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Load path once via reader, without scheduling a write."""
+        if path not in self._loaded:
+            self._loaded[path] = reader()
+        return self._loaded[path]
+
+    def _touch(self, path: Path, reader: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Load path once via reader and mark it for writing on commit."""
+        data = self._load(path, reader)
+        self._dirty[path] = None
+        return data
+
+    def _remove(
+        self,
+        path: Path,
+        reader: Callable[[], dict[str, Any]],
+        remover: Callable[[dict[str, Any]], bool],
+    ) -> None:
+        """Apply remover; only a removal that changed something is written."""
+        if remover(self._load(path, reader)):
+            self._dirty[path] = None
+
+    def add_installed(
+        self,
+        plugin_name: str,
+        install_path: str,
+        version: str = "1.0.0",
+        project_path: str | None = None,
+    ) -> None:
+        data = self._touch(get_installed_plugins_path(), _installed_plugins)
+        _add_installed(data, plugin_name, install_path, version, project_path, self.now())
+
+    def ensure_manifest(self) -> bool:
+        """Create marketplace.json with defaults if missing; True if it was."""
+        path = get_marketplace_json_path()
+        if path in self._loaded or path.exists():
+            return False
+        self._touch(path, _marketplace_manifest)
+        return True
+
+    def add_marketplace(
+        self,
+        plugin_name: str,
+        description: str,
+        version: str = "1.0.0",
+        author_name: str = "",
+    ) -> None:
+        data = self._touch(get_marketplace_json_path(), _marketplace_manifest)
+        _add_marketplace_plugin(data, plugin_name, description, version, author_name)
+
+    def remove_installed(self, plugin_name: str) -> None:
+        self._remove(
+            get_installed_plugins_path(),
+            _installed_plugins,
+            lambda data: _remove_installed(data, plugin_name),
+        )
+
+    def remove_marketplace(self, plugin_name: str) -> None:
+        path = get_marketplace_json_path()
+        if path not in self._loaded:
+            try:
+                self._loaded[path] = _stat_cached(path, _load_json)
+            except FileNotFoundError:
+                return  # never create the manifest just to remove from it
+        self._remove(
+            path,
+            _marketplace_manifest,
+            lambda data: _remove_marketplace_plugin(data, plugin_name),
+        )
+
+    def enable(self, plugin_name: str) -> None:
+        _enable(self._touch(get_settings_path(), _settings), plugin_name)
+
+    def disable(self, plugin_name: str) -> None:
+        self._remove(
+            get_settings_path(), _settings, lambda data: _disable(data, plugin_name)
+        )
+
+    def register(self, preloaded: dict[str, Any] | None = None) -> None:
+        path = get_known_marketplaces_path()
+        if preloaded is not None:
+            self._loaded.setdefault(path, preloaded)
+        _register(self._touch(path, _known_marketplaces), self.now())
+
+    def unregister(self) -> None:
+        self._remove(
+            get_known_marketplaces_path(),
+            _known_marketplaces,
+            lambda data: data.pop(MARKETPLACE_NAME, _MISSING) is not _MISSING,
+        )
+
+    def commit(self) -> None:
+        """Write every modified file once; on failure, roll back the rest."""
+        try:
+            for path in self._dirty:
+                _write_json(path, self._loaded[path])
+        except BaseException:
+            self.rollback()
+            raise
+        self._dirty.clear()
+
+    def rollback(self) -> None:
+        """Discard pending changes, including any made to cached parses."""
+        for path in self._loaded:
+            _parse_cache.pop(path, None)
+        self._loaded.clear()
+        self._dirty.clear()
@@ -8,6 +8,16 @@ from pathlib import Path
 
 import pytest
 
+from claude_local_dev.config import _reset_path_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_path_cache():
+    """Config paths are cached per process; recompute them for every test."""
+    _reset_path_cache()
+    yield
+    _reset_path_cache()
+
 
 @pytest.fixture
 def claude_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
@@ -17,15 +27,21 @@ def claude_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     (claude / "plugins").mkdir()
     (claude / "plugins" / "marketplaces").mkdir()
     monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(claude))
+    _reset_path_cache()
     return claude
 
 
-@pytest.fixture
-def populated_claude_dir(claude_dir: Path) -> Path:
-    """A claude dir pre-populated with realistic existing data.
+# Placeholders for the per-test paths baked into the populated fixture
+_CLAUDE_DIR = "@CLAUDE_DIR@"
+_HOME_DIR = "@HOME_DIR@"
 
-    Includes hooks in settings.json, an official marketplace,
-    and an existing plugin from the official marketplace.
+
+@pytest.fixture(scope="session")
+def _populated_fixture_bytes() -> tuple[bytes, bytes, bytes]:
+    """Serialize the populated registry files once per session.
+
+    Returns (settings, known_marketplaces, installed_plugins) as bytes with
+    _CLAUDE_DIR/_HOME_DIR placeholders; populated_claude_dir fills them in.
     """
     # settings.json with hooks (must be preserved)
     settings = {
@@ -48,7 +64,6 @@ def populated_claude_dir(claude_dir: Path) -> Path:
             ]
         },
     }
-    (claude_dir / "settings.json").write_text(json.dumps(settings, indent=2))
 
     # known_marketplaces.json with official marketplace
     marketplaces = {
@@ -57,15 +72,12 @@ def populated_claude_dir(claude_dir: Path) -> Path:
                 "source": "github",
                 "repo": "anthropics/claude-plugins-official",
             },
-            "installLocation": str(
-                claude_dir / "plugins" / "marketplaces" / "claude-plugins-official"
+            "installLocation": os.path.join(
+                _CLAUDE_DIR, "plugins", "marketplaces", "claude-plugins-official"
             ),
             "lastUpdated": "2026-01-01T00:00:00.000Z",
         }
     }
-    (claude_dir / "plugins" / "known_marketplaces.json").write_text(
-        json.dumps(marketplaces, indent=2)
-    )
 
     # installed_plugins.json with official plugin
     installed = {
@@ -74,29 +86,76 @@ def populated_claude_dir(claude_dir: Path) -> Path:
             "plugin-dev@claude-plugins-official": [
                 {
                     "scope": "project",
-                    "installPath": str(
-                        claude_dir
-                        / "plugins"
-                        / "marketplaces"
-                        / "claude-plugins-official"
-                        / "plugin-dev"
+                    "installPath": os.path.join(
+                        _CLAUDE_DIR,
+                        "plugins",
+                        "marketplaces",
+                        "claude-plugins-official",
+                        "plugin-dev",
                     ),
                     "version": "abc123",
                     "installedAt": "2026-01-01T00:00:00.000Z",
                     "lastUpdated": "2026-01-01T00:00:00.000Z",
                     "gitCommitSha": "abc123",
-                    "projectPath": str(claude_dir.parent),
+                    "projectPath": _HOME_DIR,
                 }
             ]
         },
     }
-    (claude_dir / "plugins" / "installed_plugins.json").write_text(
-        json.dumps(installed, indent=2)
+
+    return tuple(
+        json.dumps(data, indent=2).encode()
+        for data in (settings, marketplaces, installed)
     )
 
+
+def _dump_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with bare os.open/os.write (no Path or io layer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _json_escaped(path: Path) -> bytes:
+    """path as it appears inside a JSON string (backslashes escaped)."""
+    return json.dumps(str(path))[1:-1].encode()
+
+
+@pytest.fixture
+def populated_claude_dir(
+    claude_dir: Path, _populated_fixture_bytes: tuple[bytes, bytes, bytes]
+) -> Path:
+    """A claude dir pre-populated with realistic existing data.
+
+    Includes hooks in settings.json, an official marketplace,
+    and an existing plugin from the official marketplace.
+    """
+    claude = _json_escaped(claude_dir)
+    home = _json_escaped(claude_dir.parent)
+    settings, marketplaces, installed = (
+        raw.replace(_CLAUDE_DIR.encode(), claude).replace(_HOME_DIR.encode(), home)
+        for raw in _populated_fixture_bytes
+    )
+    _dump_bytes(claude_dir / "settings.json", settings)
+    _dump_bytes(claude_dir / "plugins" / "known_marketplaces.json", marketplaces)
+    _dump_bytes(claude_dir / "plugins" / "installed_plugins.json", installed)
     return claude_dir
 
 
+_PLUGIN_JSON = json.dumps(
+    {
+        "name": "my-test-plugin",
+        "version": "1.0.0",
+        "description": "A test plugin",
+    },
+    indent=2,
+).encode()
+
+
 @pytest.fixture
 def mock_plugin(tmp_path: Path) -> Path:
     """Create a minimal valid plugin directory."""
@@ -104,10 +163,5 @@ def mock_plugin(tmp_path: Path) -> Path:
     plugin_dir.mkdir()
     dot_claude = plugin_dir / ".claude-plugin"
     dot_claude.mkdir()
-    plugin_json = {
-        "name": "my-test-plugin",
-        "version": "1.0.0",
-        "description": "A test plugin",
-    }
-    (dot_claude / "plugin.json").write_text(json.dumps(plugin_json, indent=2))
+    _dump_bytes(dot_claude / "plugin.json", _PLUGIN_JSON)
     return plugin_dir
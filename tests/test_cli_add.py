@@ -8,6 +8,8 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from claude_local_dev.cli import app
+from claude_local_dev.commands.add import add
+from claude_local_dev.commands.init import init
 from claude_local_dev.junction import is_link
 
 runner = CliRunner()
@@ -15,7 +17,7 @@ runner = CliRunner()
 
 def _init_marketplace(claude_dir: Path) -> None:
     """Helper: run init first so add can work."""
-    runner.invoke(app, ["init"])
+    init()
 
 
 def test_add_registers_plugin(
@@ -70,7 +72,7 @@ def test_add_fails_for_invalid_plugin(populated_claude_dir: Path, tmp_path: Path
 
 def test_add_idempotent(populated_claude_dir: Path, mock_plugin: Path) -> None:
     _init_marketplace(populated_claude_dir)
-    runner.invoke(app, ["add", str(mock_plugin)])
+    add(mock_plugin)
     result = runner.invoke(app, ["add", str(mock_plugin)])
     assert result.exit_code == 0
     assert "already registered" in result.output
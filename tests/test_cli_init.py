@@ -8,6 +8,7 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from claude_local_dev.cli import app
+from claude_local_dev.commands.init import init
 
 runner = CliRunner()
 
@@ -27,7 +28,7 @@ def test_init_creates_structure(claude_dir: Path) -> None:
 
 
 def test_init_idempotent(claude_dir: Path) -> None:
-    runner.invoke(app, ["init"])
+    init()
     result = runner.invoke(app, ["init"])
     assert result.exit_code == 0
     assert "already registered" in result.output
@@ -7,20 +7,22 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from claude_local_dev.cli import app
+from claude_local_dev.commands.add import add
+from claude_local_dev.commands.init import init
 
 runner = CliRunner()
 
 
 def test_list_empty(claude_dir: Path) -> None:
-    runner.invoke(app, ["init"])
+    init()
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
     assert "No local-dev plugins" in result.output
 
 
 def test_list_shows_plugin(populated_claude_dir: Path, mock_plugin: Path) -> None:
-    runner.invoke(app, ["init"])
-    runner.invoke(app, ["add", str(mock_plugin)])
+    init()
+    add(mock_plugin)
 
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
@@ -8,6 +8,8 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from claude_local_dev.cli import app
+from claude_local_dev.commands.add import add
+from claude_local_dev.commands.init import init
 from claude_local_dev.junction import is_link
 
 runner = CliRunner()
@@ -15,8 +17,8 @@ runner = CliRunner()
 
 def _setup_plugin(claude_dir: Path, mock_plugin: Path) -> None:
     """Init marketplace and add a plugin."""
-    runner.invoke(app, ["init"])
-    runner.invoke(app, ["add", str(mock_plugin)])
+    init()
+    add(mock_plugin)
 
 
 def test_remove_cleans_everything(
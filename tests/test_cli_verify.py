@@ -8,6 +8,8 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from claude_local_dev.cli import app
+from claude_local_dev.commands.add import add
+from claude_local_dev.commands.init import init
 from claude_local_dev.config import get_local_dev_plugins_dir
 from claude_local_dev.registry import (
     add_installed_plugin,
@@ -18,8 +20,8 @@ runner = CliRunner()
 
 
 def test_verify_clean_state(populated_claude_dir: Path, mock_plugin: Path) -> None:
-    runner.invoke(app, ["init"])
-    runner.invoke(app, ["add", str(mock_plugin)])
+    init()
+    add(mock_plugin)
 
     result = runner.invoke(app, ["verify"])
     assert result.exit_code == 0
@@ -27,7 +29,7 @@ def test_verify_clean_state(populated_claude_dir: Path, mock_plugin: Path) -> No
 
 
 def test_verify_detects_missing_junction(populated_claude_dir: Path) -> None:
-    runner.invoke(app, ["init"])
+    init()
     # Add to registry but don't create junction
     add_installed_plugin("ghost-plugin", "/nonexistent")
     enable_plugin("ghost-plugin")
@@ -41,7 +43,7 @@ def test_verify_detects_missing_junction(populated_claude_dir: Path) -> None:
 def test_verify_detects_enabled_not_installed(
     populated_claude_dir: Path,
 ) -> None:
-    runner.invoke(app, ["init"])
+    init()
     enable_plugin("orphan")
 
     result = runner.invoke(app, ["verify"])
@@ -57,7 +59,22 @@ def test_verify_no_marketplace(claude_dir: Path) -> None:
 
 
 def test_verify_empty_marketplace(claude_dir: Path) -> None:
-    runner.invoke(app, ["init"])
+    init()
     result = runner.invoke(app, ["verify"])
     assert result.exit_code == 0
     assert "0 plugin(s)" in result.output
+
+
+def test_verify_detects_broken_junction(
+    populated_claude_dir: Path, mock_plugin: Path
+) -> None:
+    init()
+    add(mock_plugin)
+    (mock_plugin / ".claude-plugin" / "plugin.json").unlink()
+    (mock_plugin / ".claude-plugin").rmdir()
+    mock_plugin.rmdir()
+
+    result = runner.invoke(app, ["verify"])
+    assert result.exit_code == 1
+    assert "junction target missing" in result.output
+    assert "no cache entry" in result.output
@@ -13,6 +13,7 @@ from claude_local_dev.config import (
     get_plugins_dir,
     get_settings_path,
     MARKETPLACE_NAME,
+    paths,
 )
 
 
@@ -33,6 +34,13 @@ def test_path_hierarchy(claude_dir: Path) -> None:
     )
 
 
+def test_paths_namespace(claude_dir: Path) -> None:
+    local_dev = claude_dir / "plugins" / "marketplaces" / "local-dev"
+    assert paths().marketplace == local_dev
+    assert paths().plugins == local_dev / "plugins"
+    assert paths().cache == claude_dir / "plugins" / "cache" / "local-dev"
+
+
 def test_json_paths(claude_dir: Path) -> None:
     assert get_settings_path() == claude_dir / "settings.json"
     assert get_installed_plugins_path() == claude_dir / "plugins" / "installed_plugins.json"
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import errno
 import os
+import struct
 import sys
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 
 import pytest
 
+from claude_local_dev import junction
 from claude_local_dev.junction import (
     create_link,
+    dir_names,
+    ensure_dir,
+    fast_exists,
     is_link,
     is_link_healthy,
     link_target,
     remove_link,
+    scan_links,
 )
 from claude_local_dev.errors import JunctionError
 
@@ -117,3 +124,109 @@ class TestIsLinkHealthy:
 
     def test_unhealthy_missing_path(self, tmp_path: Path) -> None:
         assert is_link_healthy(tmp_path / "missing") is False
+
+
+class TestEnsureDir:
+    def test_creates_nested(self, tmp_path: Path) -> None:
+        d = tmp_path / "a" / "b" / "c"
+        ensure_dir(d)
+        assert d.is_dir()
+
+    def test_existing_dir_is_noop(self, target_dir: Path) -> None:
+        ensure_dir(target_dir)
+        assert (target_dir / "marker.txt").exists()
+
+
+class TestFastExists:
+    def test_existing_dir(self, target_dir: Path) -> None:
+        assert fast_exists(target_dir) is True
+
+    def test_missing_path(self, tmp_path: Path) -> None:
+        assert fast_exists(tmp_path / "missing" / "deeper") is False
+
+    def test_follows_links(self, link_path: Path, tmp_path: Path) -> None:
+        doomed = tmp_path / "doomed"
+        doomed.mkdir()
+        create_link(link_path, doomed)
+        assert fast_exists(link_path) is True
+        doomed.rmdir()
+        assert fast_exists(link_path) is False
+
+    @pytest.mark.parametrize("err", [errno.ENOSYS, errno.EPERM])
+    def test_blocked_statx_falls_back(
+        self, target_dir: Path, monkeypatch: pytest.MonkeyPatch, err: int
+    ) -> None:
+        monkeypatch.setattr(junction, "_load_statx", lambda: lambda path: err)
+        assert fast_exists(target_dir) is True
+
+
+class TestScanLinks:
+    def test_reports_links_and_plain_dirs(
+        self, link_path: Path, target_dir: Path
+    ) -> None:
+        create_link(link_path, target_dir)
+        (link_path.parent / "plain").mkdir()
+        links = scan_links(link_path.parent)
+        assert links["my-link"].is_link is True
+        assert links["my-link"].target_exists is True
+        assert links["plain"].is_link is False
+
+    def test_broken_link(self, link_path: Path, tmp_path: Path) -> None:
+        doomed = tmp_path / "doomed"
+        doomed.mkdir()
+        create_link(link_path, doomed)
+        doomed.rmdir()
+        info = scan_links(link_path.parent)["my-link"]
+        assert info.is_link is True
+        assert info.target_exists is False
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        assert scan_links(tmp_path / "missing") == {}
+
+
+def test_dir_names(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b.txt").write_text("")
+    assert dir_names(tmp_path) == {"a", "b.txt"}
+    assert dir_names(tmp_path / "missing") == frozenset()
+
+
+class TestMountPointBuffer:
+    """The junction reparse buffer is plain bytes, so it is checked on every OS."""
+
+    @staticmethod
+    def _unpack(buf: bytes) -> tuple[int, int, str, str]:
+        tag, data_len, reserved, sub_off, sub_len, print_off, print_len = struct.unpack(
+            "<LHHHHHH", buf[:16]
+        )
+        assert reserved == 0
+        # ReparseDataLength counts everything after the 8-byte common header
+        assert data_len == len(buf) - 8
+        path_buffer = buf[16:]
+        substitute = path_buffer[sub_off:sub_off + sub_len].decode("utf-16-le")
+        printable = path_buffer[print_off:print_off + print_len].decode("utf-16-le")
+        # Each name is NUL-terminated inside PathBuffer
+        assert path_buffer[sub_off + sub_len:sub_off + sub_len + 2] == b"\0\0"
+        assert path_buffer[print_off + print_len:] == b"\0\0"
+        assert print_off == sub_len + 2
+        return tag, sub_off, substitute, printable
+
+    def test_layout(self) -> None:
+        buf = junction._mount_point_buffer(PureWindowsPath(r"C:\dev\my-plugin"))
+        tag, sub_off, substitute, printable = self._unpack(buf)
+        assert tag == 0xA0000003
+        assert sub_off == 0
+        assert substitute == r"\??\C:\dev\my-plugin"
+        assert printable == r"C:\dev\my-plugin"
+
+    def test_strips_extended_length_prefix(self) -> None:
+        buf = junction._mount_point_buffer(PureWindowsPath(r"\\?\C:\dev\my-plugin"))
+        _, _, substitute, printable = self._unpack(buf)
+        assert substitute == r"\??\C:\dev\my-plugin"
+        assert printable == r"C:\dev\my-plugin"
+
+    def test_non_ascii_target(self) -> None:
+        buf = junction._mount_point_buffer(PureWindowsPath(r"C:\Users\José\plugin"))
+        _, _, substitute, printable = self._unpack(buf)
+        assert substitute == r"\??\C:\Users\José\plugin"
+        assert printable == r"C:\Users\José\plugin"
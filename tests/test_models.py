@@ -1,7 +1,12 @@
-"""Tests for models.py — Pydantic schema validation."""
+"""Tests for models.py — schema serialization."""
 
 from __future__ import annotations
 
+import dataclasses
+import re
+
+import pytest
+
 from claude_local_dev.models import (
     InstalledPluginsFile,
     MarketplaceEntry,
@@ -15,11 +20,11 @@ from claude_local_dev.models import (
 def test_plugin_install_record_roundtrip() -> None:
     record = PluginInstallRecord(
         scope="project",
-        installPath="C:/test/path",
+        install_path="C:/test/path",
         version="1.0.0",
-        installedAt="2026-01-01T00:00:00.000Z",
-        lastUpdated="2026-01-01T00:00:00.000Z",
-        projectPath="C:/home",
+        installed_at="2026-01-01T00:00:00.000Z",
+        last_updated="2026-01-01T00:00:00.000Z",
+        project_path="C:/home",
     )
     d = record.to_json_dict()
     assert d["installPath"] == "C:/test/path"
@@ -30,17 +35,28 @@ def test_plugin_install_record_roundtrip() -> None:
 def test_plugin_install_record_with_sha() -> None:
     record = PluginInstallRecord(
         scope="project",
-        installPath="/test",
+        install_path="/test",
         version="abc",
-        installedAt="2026-01-01T00:00:00.000Z",
-        lastUpdated="2026-01-01T00:00:00.000Z",
-        gitCommitSha="abc123",
-        projectPath="/home",
+        installed_at="2026-01-01T00:00:00.000Z",
+        last_updated="2026-01-01T00:00:00.000Z",
+        git_commit_sha="abc123",
+        project_path="/home",
     )
     d = record.to_json_dict()
     assert d["gitCommitSha"] == "abc123"
 
 
+def test_plugin_install_record_is_frozen() -> None:
+    record = PluginInstallRecord(
+        install_path="/test",
+        installed_at="2026-01-01T00:00:00.000Z",
+        last_updated="2026-01-01T00:00:00.000Z",
+        project_path="/home",
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.version = "2.0.0"  # type: ignore[misc]
+
+
 def test_installed_plugins_file_defaults() -> None:
     f = InstalledPluginsFile()
     assert f.version == 2
@@ -50,8 +66,8 @@ def test_installed_plugins_file_defaults() -> None:
 def test_marketplace_entry_roundtrip() -> None:
     entry = MarketplaceEntry(
         source=MarketplaceSource(source="directory", path="/test"),
-        installLocation="/test",
-        lastUpdated="2026-01-01T00:00:00.000Z",
+        install_location="/test",
+        last_updated="2026-01-01T00:00:00.000Z",
     )
     d = entry.to_json_dict()
     assert d["source"]["source"] == "directory"
@@ -63,14 +79,18 @@ def test_marketplace_entry_roundtrip() -> None:
 def test_marketplace_entry_github() -> None:
     entry = MarketplaceEntry(
         source=MarketplaceSource(source="github", repo="org/repo"),
-        installLocation="/somewhere",
-        lastUpdated="2026-01-01T00:00:00.000Z",
+        install_location="/somewhere",
+        last_updated="2026-01-01T00:00:00.000Z",
     )
     d = entry.to_json_dict()
     assert d["source"]["repo"] == "org/repo"
     assert "path" not in d["source"]
 
 
+def test_marketplace_source_omits_unset() -> None:
+    assert MarketplaceSource(source="directory").to_json_dict() == {"source": "directory"}
+
+
 def test_make_install_record() -> None:
     record = make_install_record(
         plugin_name="test",
@@ -78,14 +98,19 @@ def test_make_install_record() -> None:
         version="2.0.0",
         project_path="/home/user",
     )
-    assert record.install_path == "/plugins/test"
-    assert record.version == "2.0.0"
-    assert record.project_path == "/home/user"
-    assert record.installed_at == record.last_updated
+    assert record["installPath"] == "/plugins/test"
+    assert record["version"] == "2.0.0"
+    assert record["projectPath"] == "/home/user"
+    assert record["installedAt"] == record["lastUpdated"]
+    assert "gitCommitSha" not in record
 
 
 def test_make_local_dev_marketplace() -> None:
     entry = make_local_dev_marketplace("/my/path")
-    assert entry.source.source == "directory"
-    assert entry.source.path == "/my/path"
-    assert entry.install_location == "/my/path"
+    assert entry["source"] == {"source": "directory", "path": "/my/path"}
+    assert entry["installLocation"] == "/my/path"
+
+
+def test_timestamp_format() -> None:
+    stamp = make_install_record("t", "/p", project_path="/h")["installedAt"]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.000Z", stamp)
@@ -6,13 +6,17 @@ do NOT corrupt or drop data belonging to other plugins/marketplaces.
 
 from __future__ import annotations
 
+import errno
 import json
+import os
+import stat
+import sys
 from pathlib import Path
 
 import pytest
 
 from claude_local_dev import registry
-from claude_local_dev.errors import RegistryCorrupted
+from claude_local_dev.errors import PluginNotFound, RegistryCorrupted
 
 
 # --- settings.json ---
@@ -54,6 +58,33 @@ class TestSettingsPreservation:
         data = json.loads((populated_claude_dir / "settings.json").read_text())
         assert "hooks" in data
 
+    def test_noop_removals_do_not_write(self, claude_dir: Path) -> None:
+        registry.disable_plugin("nonexistent")
+        registry.remove_installed_plugin("nonexistent")
+        registry.unregister_marketplace()
+        assert not (claude_dir / "settings.json").exists()
+        assert not (claude_dir / "plugins" / "installed_plugins.json").exists()
+        assert not (claude_dir / "plugins" / "known_marketplaces.json").exists()
+
+    def test_enable_preserves_values_orjson_cannot_hold(self, claude_dir: Path) -> None:
+        path = claude_dir / "settings.json"
+        path.write_text(
+            '{"big": 18446744073709551616, "low": -9223372036854775809,'
+            ' "nan": NaN, "inf": -Infinity, "huge": [1e400], "lone": "\\ud800"}'
+        )
+        registry.enable_plugin("x")
+        text = path.read_text()
+        for literal in (
+            "18446744073709551616",
+            "-9223372036854775809",
+            "NaN",
+            "-Infinity",
+            "1e400",
+            '"\\ud800"',
+        ):
+            assert literal in text
+        assert registry.is_plugin_enabled("x") is True
+
     def test_enable_creates_file_if_missing(self, claude_dir: Path) -> None:
         registry.enable_plugin("my-plugin")
         data = json.loads((claude_dir / "settings.json").read_text())
@@ -194,6 +225,14 @@ class TestMarketplacePreservation:
         registry.register_marketplace()
         assert registry.is_marketplace_registered() is True
 
+    def test_load_then_register_preloaded(self, populated_claude_dir: Path) -> None:
+        data, registered = registry.load_known_marketplaces()
+        assert registered is False
+        registry.register_marketplace(preloaded=data)
+        data, registered = registry.load_known_marketplaces()
+        assert registered is True
+        assert "claude-plugins-official" in data
+
     def test_creates_file_if_missing(self, claude_dir: Path) -> None:
         registry.register_marketplace()
         data = json.loads(
@@ -202,6 +241,229 @@ class TestMarketplacePreservation:
         assert data["local-dev"]["source"]["source"] == "directory"
 
 
+class TestReadCache:
+    """Parsed registry files are reused until the file changes on disk."""
+
+    def test_unchanged_file_is_not_reparsed(self, populated_claude_dir: Path) -> None:
+        path = populated_claude_dir / "settings.json"
+        assert registry._read_json(path) is registry._read_json(path)
+
+    def test_external_edit_is_seen(self, populated_claude_dir: Path) -> None:
+        path = populated_claude_dir / "settings.json"
+        assert registry.read_settings()["autoUpdatesChannel"] == "latest"
+        st = path.stat()
+        path.write_text(json.dumps({"autoUpdatesChannel": "stable"}))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert registry.read_settings()["autoUpdatesChannel"] == "stable"
+
+    def test_same_mtime_size_change_is_seen(self, populated_claude_dir: Path) -> None:
+        path = populated_claude_dir / "settings.json"
+        registry.read_settings()
+        st = path.stat()
+        path.write_text(json.dumps({"autoUpdatesChannel": "stable"}))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert registry.read_settings()["autoUpdatesChannel"] == "stable"
+
+    def test_write_is_seen(self, claude_dir: Path) -> None:
+        assert registry.is_plugin_enabled("x") is False
+        registry.enable_plugin("x")
+        assert registry.is_plugin_enabled("x") is True
+
+    def test_read_result_is_a_copy(self, populated_claude_dir: Path) -> None:
+        registry.read_settings().setdefault("enabledPlugins", {})["x@local-dev"] = True
+        data = registry.read_installed_plugins()
+        data.setdefault("plugins", {})["y@local-dev"] = [{"scope": "user"}]
+        assert registry.is_plugin_enabled("x") is False
+        assert registry.get_installed_plugin("y") is None
+
+    def test_written_dict_is_not_cached(self, claude_dir: Path) -> None:
+        data = {"enabledPlugins": {}}
+        registry.write_settings(data)
+        data["enabledPlugins"]["x@local-dev"] = True
+        assert registry.is_plugin_enabled("x") is False
+
+
+def test_snapshot(populated_claude_dir: Path) -> None:
+    registry.add_installed_plugin("a", "/a", version="2.0.0")
+    registry.enable_plugin("b")
+    registry.add_marketplace_plugin("a", "desc")
+    snap = registry.snapshot()
+    assert snap.registered is False
+    assert snap.enabled - snap.installed == {"b"}
+    assert snap.installed - snap.enabled == {"a"}
+    assert snap.manifest == {"a"}
+    assert snap.versions == {"a": "2.0.0"}
+
+
+class TestAtomicWrite:
+    """Registry files are replaced whole, never written in place."""
+
+    def test_no_temp_file_left_behind(self, claude_dir: Path) -> None:
+        registry.enable_plugin("x")
+        assert sorted(p.name for p in claude_dir.glob("settings.json*")) == [
+            "settings.json"
+        ]
+
+    def test_failed_replace_cleans_up(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(src: object, dst: object) -> None:
+            raise PermissionError("locked")
+
+        monkeypatch.setattr(registry.os, "replace", fail)
+        with pytest.raises(PermissionError):
+            registry._atomic_write_bytes(tmp_path / "f.json", b"{}")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_temp_write_cleans_up(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(self: Path, data: bytes) -> int:
+            with open(self, "wb") as f:
+                f.write(data[:1])
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(Path, "write_bytes", fail)
+        with pytest.raises(OSError):
+            registry._atomic_write_bytes(tmp_path / "f.json", b"{}")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_identical_payload_is_not_rewritten(self, claude_dir: Path) -> None:
+        registry.enable_plugin("x")
+        path = claude_dir / "settings.json"
+        before = path.stat()
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns - 1_000_000_000))
+        marked = path.stat().st_mtime_ns
+        registry.enable_plugin("x")
+        assert path.stat().st_mtime_ns == marked
+        assert path.stat().st_ino == before.st_ino
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+    def test_symlinked_file_is_written_through(
+        self, claude_dir: Path, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "dotfiles" / "settings.json"
+        target.parent.mkdir()
+        target.write_text('{"hooks": {}}')
+        link = claude_dir / "settings.json"
+        link.symlink_to(target)
+        registry.enable_plugin("x")
+        assert link.is_symlink()
+        assert json.loads(target.read_text())["enabledPlugins"] == {"x@local-dev": True}
+        assert "hooks" in json.loads(target.read_text())
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_file_mode_is_preserved(self, claude_dir: Path) -> None:
+        path = claude_dir / "settings.json"
+        path.write_text("{}")
+        path.chmod(0o600)
+        registry.enable_plugin("x")
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_creates_missing_parent(self, tmp_path: Path) -> None:
+        path = tmp_path / "a" / "b" / "file.json"
+        registry._write_json(path, {"k": 1})
+        assert json.loads(path.read_text()) == {"k": 1}
+
+
+# --- Transactions ---
+
+
+class TestTransaction:
+    """Batched mutations write each file once and preserve foreign data."""
+
+    def test_commit_writes_all_files(self, populated_claude_dir: Path) -> None:
+        with registry.RegistryTransaction() as tx:
+            tx.add_installed("my-plugin", "/install/my-plugin")
+            tx.add_marketplace("my-plugin", "desc")
+            tx.enable("my-plugin")
+
+        settings = json.loads((populated_claude_dir / "settings.json").read_text())
+        assert settings["enabledPlugins"]["my-plugin@local-dev"] is True
+        assert "hooks" in settings
+        installed = json.loads(
+            (populated_claude_dir / "plugins" / "installed_plugins.json").read_text()
+        )
+        assert "my-plugin@local-dev" in installed["plugins"]
+        assert "plugin-dev@claude-plugins-official" in installed["plugins"]
+        manifest = registry.read_marketplace_manifest()
+        assert [p["name"] for p in manifest["plugins"]] == ["my-plugin"]
+
+    def test_exception_writes_nothing(self, populated_claude_dir: Path) -> None:
+        with pytest.raises(RuntimeError):
+            with registry.RegistryTransaction() as tx:
+                tx.enable("my-plugin")
+                raise RuntimeError("boom")
+
+        assert registry.is_plugin_enabled("my-plugin") is False
+
+    def test_failed_commit_discards_pending_changes(
+        self, populated_claude_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(path: Path, data: bytes) -> None:
+            raise PermissionError("locked")
+
+        monkeypatch.setattr(registry, "_atomic_write_bytes", fail)
+        with pytest.raises(PermissionError):
+            with registry.RegistryTransaction() as tx:
+                tx.add_installed("my-plugin", "/install/my-plugin")
+                tx.enable("my-plugin")
+        monkeypatch.undo()
+
+        assert registry.get_installed_plugin("my-plugin") is None
+        assert registry.is_plugin_enabled("my-plugin") is False
+
+    def test_entries_share_one_timestamp(self, claude_dir: Path) -> None:
+        with registry.RegistryTransaction() as tx:
+            tx.add_installed("a", "/a")
+            tx.add_installed("b", "/b")
+            tx.register()
+        stamps = {
+            records[0]["installedAt"]
+            for records in registry.list_installed_local_dev_plugins().values()
+        }
+        stamps.add(registry.read_known_marketplaces()["local-dev"]["lastUpdated"])
+        assert stamps == {tx.now()}
+
+    def test_ensure_manifest_only_creates_once(self, claude_dir: Path) -> None:
+        with registry.RegistryTransaction() as tx:
+            assert tx.ensure_manifest() is True
+            assert tx.ensure_manifest() is False
+        assert registry.read_marketplace_manifest()["plugins"] == []
+        with registry.RegistryTransaction() as tx:
+            assert tx.ensure_manifest() is False
+
+    def test_null_entries_are_removed_from_disk(self, claude_dir: Path) -> None:
+        registry.write_settings({"enabledPlugins": {"x@local-dev": None}})
+        registry.write_installed_plugins({"plugins": {"x@local-dev": None}})
+        registry.write_known_marketplaces({"local-dev": None})
+        with registry.RegistryTransaction() as tx:
+            tx.disable("x")
+            tx.remove_installed("x")
+            tx.unregister()
+
+        assert json.loads((claude_dir / "settings.json").read_text()) == {
+            "enabledPlugins": {}
+        }
+        installed = claude_dir / "plugins" / "installed_plugins.json"
+        assert json.loads(installed.read_text()) == {"plugins": {}}
+        known = claude_dir / "plugins" / "known_marketplaces.json"
+        assert json.loads(known.read_text()) == {}
+
+    def test_module_mutators_accept_tx(self, populated_claude_dir: Path) -> None:
+        registry.enable_plugin("my-plugin")
+        registry.add_installed_plugin("my-plugin", "/install/my-plugin")
+        with registry.RegistryTransaction() as tx:
+            registry.remove_installed_plugin("my-plugin", tx=tx)
+            registry.remove_marketplace_plugin("my-plugin", tx=tx)
+            registry.disable_plugin("my-plugin", tx=tx)
+
+        assert registry.is_plugin_enabled("my-plugin") is False
+        assert registry.get_installed_plugin("my-plugin") is None
+        assert not (populated_claude_dir / "plugins" / "marketplaces" / "local-dev"
+                    / ".claude-plugin" / "marketplace.json").exists()
+
+
 # --- Plugin metadata ---
 
 
@@ -210,10 +472,47 @@ class TestPluginMetadata:
         meta = registry.read_plugin_json(mock_plugin)
         assert meta["name"] == "my-test-plugin"
 
+    def test_read_plugin_json_sees_edits(self, mock_plugin: Path) -> None:
+        pj = mock_plugin / ".claude-plugin" / "plugin.json"
+        assert registry.read_plugin_json(mock_plugin)["name"] == "my-test-plugin"
+        st = pj.stat()
+        pj.write_text('{"name": "renamed"}')
+        os.utime(pj, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert registry.read_plugin_json(mock_plugin)["name"] == "renamed"
+
+    def test_read_plugin_json_sees_same_mtime_edit(self, mock_plugin: Path) -> None:
+        pj = mock_plugin / ".claude-plugin" / "plugin.json"
+        registry.read_plugin_json(mock_plugin)
+        st = pj.stat()
+        pj.write_text('{"name": "other"}')
+        os.utime(pj, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert registry.read_plugin_json(mock_plugin)["name"] == "other"
+
+    def test_read_plugin_json_is_a_copy(self, mock_plugin: Path) -> None:
+        pj = mock_plugin / ".claude-plugin" / "plugin.json"
+        pj.write_text('{"name": "my-test-plugin", "author": {"name": "me"}}')
+        registry.read_plugin_json(mock_plugin)["author"]["name"] = "changed"
+        assert registry.read_plugin_json(mock_plugin)["author"]["name"] == "me"
+        assert registry.read_plugin_metadata(mock_plugin).raw["author"]["name"] == "me"
+
     def test_read_missing_plugin_json(self, tmp_path: Path) -> None:
         meta = registry.read_plugin_json(tmp_path / "nonexistent")
         assert meta == {}
 
+    def test_read_missing_required_plugin_json(self, tmp_path: Path) -> None:
+        with pytest.raises(PluginNotFound, match="plugin.json"):
+            registry.read_plugin_json(tmp_path, required=True)
+
+    def test_read_plugin_metadata(self, mock_plugin: Path) -> None:
+        meta = registry.read_plugin_metadata(mock_plugin)
+        assert (meta.name, meta.version) == ("my-test-plugin", "1.0.0")
+        assert meta.raw["name"] == "my-test-plugin"
+
+    def test_read_empty_plugin_json(self, tmp_path: Path) -> None:
+        (tmp_path / ".claude-plugin").mkdir()
+        (tmp_path / ".claude-plugin" / "plugin.json").write_bytes(b"")
+        assert registry.read_plugin_json(tmp_path) == {}
+
     def test_get_plugin_name(self, mock_plugin: Path) -> None:
         assert registry.get_plugin_name(mock_plugin) == "my-test-plugin"
 
@@ -252,6 +551,16 @@ class TestCorruptedJsonHandling:
         with pytest.raises(RegistryCorrupted, match="known_marketplaces.json"):
             registry.read_known_marketplaces()
 
+    def test_leading_whitespace_is_accepted(self, claude_dir: Path) -> None:
+        (claude_dir / "settings.json").write_text('\n  {"autoUpdatesChannel": "x"}')
+        assert registry.read_settings() == {"autoUpdatesChannel": "x"}
+
+    def test_blank_file_reads_as_empty(self, claude_dir: Path) -> None:
+        (claude_dir / "settings.json").write_text("")
+        assert registry.read_settings() == {}
+        (claude_dir / "plugins" / "installed_plugins.json").write_text(" \n\t\n")
+        assert registry.read_installed_plugins() == {}
+
 
 class TestPluginNameValidation:
     """GAP 6: Plugin names must be filesystem-safe."""
@@ -275,3 +584,19 @@ class TestPluginNameValidation:
     def test_starts_with_dash(self) -> None:
         with pytest.raises(ValueError, match="Invalid plugin name"):
             registry.validate_plugin_name("-bad")
+
+    def test_matches_documented_pattern(self) -> None:
+        names = ["ok", "a.b-c_d", "_x", "x/y", "x y", "x\n", "é", "9lives", "a" * 64]
+        for name in names:
+            expected = registry._VALID_PLUGIN_NAME.fullmatch(name) is not None
+            try:
+                registry.validate_plugin_name(name)
+            except ValueError:
+                assert not expected, name
+            else:
+                assert expected, name
+
+    def test_non_ascii_and_newline(self) -> None:
+        for name in ["plügin", "１abc", "name\n"]:
+            with pytest.raises(ValueError, match="Invalid plugin name"):
+                registry.validate_plugin_name(name)